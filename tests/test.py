@@ -1,35 +1,99 @@
 import json
+import os
+import tempfile
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.apps import apps
-from django.http import HttpRequest
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from django.core.management import call_command
+from django.http import Http404, HttpRequest
+from django.template import RequestContext, Template
+from django.test import (
+    AsyncRequestFactory,
+    RequestFactory,
+    TestCase,
+    override_settings,
+)
 from django.urls import reverse, resolve
+from django.utils import timezone
+from django.utils.datastructures import MultiValueDict
 from rest_framework.request import Request
+from wagtail import blocks, hooks
 from wagtail.blocks.struct_block import StructBlockValidationError
+from wagtail.models import TranslatableMixin
 from wagtail_localize.operations import translate_object
+from wagtailstreamforms import hooks as form_hooks
 from wagtail_localize.models import (
     TranslationSource,
     Translation,
     StringSegment,
 )
 from wagtail_translatableforms import get_translatableform_model
+from wagtail_translatableforms.api_views import (
+    TranslatableFormsBulkAPIView,
+    form_detail,
+    form_submit,
+)
 from wagtail_translatableforms.blocks import TranslatableFormBlock
-from wagtail_translatableforms.models import CustomFormSubmission
-from wagtail_translatableforms.serializers import TranslatableFormSerializer
+from wagtail_translatableforms.cache import form_cache
+from wagtail_translatableforms.file_uploads import store_files
+from wagtail_translatableforms.models import (
+    CustomFormSubmission,
+    CustomFormSubmissionFile,
+    FormSubmissionQueueItem,
+    FormSubmissionStats,
+)
+from wagtail_translatableforms.operations import create_translations
+from wagtail_translatableforms.submission_hooks import (
+    SubmissionHooksError,
+    get_submission_hooks,
+    independent_hook,
+)
+from wagtail_translatableforms.submission_queue import (
+    claim_queue_items,
+    process_submission_queue,
+)
+from wagtail_translatableforms.serializers import (
+    TranslatableFormSerializer,
+    aserialize_form,
+    prefetch_forms,
+    serialize_form,
+    serialize_forms,
+)
+from wagtail_translatableforms.translation_sync import defer_translation_source_sync
+from wagtail_translatableforms.utils import (
+    get_translatable_content_fingerprint,
+    get_unique_fields_names,
+    get_unique_fields_names_from_source,
+)
 from wagtail_translatableforms.views import (
+    CustomFormModelAdmin,
     CustomSubmissionDeleteView,
+    CustomSubmissionExportView,
     CustomSubmissionListView,
 )
 
 from .exceptions import FormNotValidError
 
+
+def hook_timing_callback(instance, hook_name, duration):
+    pass
+
+
 class TranslatableModelTestCase(TestCase):
 
     def setUp(self):
-        self.create_model_instance()
-        self.add_fr_locale()
-        self.submit_form()
-        self.translate_instance()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_model_instance()
+            self.add_fr_locale()
+            self.submit_form()
+            self.translate_instance()
 
     def test_model_creation(self):
         self.assertEqual(
@@ -43,9 +107,509 @@ class TranslatableModelTestCase(TestCase):
 
     def test_form_submission(self):
         form_submission = self.get_form_submission()
-        form_data = json.loads(form_submission.form_data)
+        form_data = form_submission.get_data()
         self.assertEqual(form_data.get("IP"), "-")
 
+    def test_convert_submissions_form_data(self):
+        instance = self.get_model_instance().first()
+        submission = CustomFormSubmission.objects.create(
+            form=instance,
+            form_data_text=json.dumps({"name": "Bob"}),
+        )
+        call_command(
+            "convert_submissions_form_data", batch_size=1, stdout=StringIO()
+        )
+        submission.refresh_from_db()
+        self.assertEqual(submission.form_data, {"name": "Bob"})
+        self.assertEqual(submission.form_data_text, "")
+        self.assertEqual(submission.get_data()["name"], "Bob")
+        # row created without form data in either column
+        submission = CustomFormSubmission.objects.create(form=instance)
+        self.assertEqual(submission.get_form_data(), {})
+        self.assertEqual(str(submission), "{}")
+        call_command("convert_submissions_form_data", stdout=StringIO())
+        submission.refresh_from_db()
+        self.assertEqual(submission.form_data, {})
+
+    def test_form_submission_files(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                instance = self.create_model_instance_with_file_field()
+                self.submit_form_with_file(instance)
+                submission_file = CustomFormSubmissionFile.objects.get(
+                    submission__form=instance,
+                )
+                self.assertEqual(submission_file.field, "document")
+                self.assertEqual(
+                    submission_file.file.storage.exists(submission_file.file.name),
+                    True,
+                )
+
+    def test_form_submission_files_rollback(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                instance = self.create_model_instance_with_file_field()
+                with mock.patch.object(
+                    CustomFormSubmissionFile.objects,
+                    "bulk_create",
+                    side_effect=IntegrityError,
+                ):
+                    with self.assertRaises(IntegrityError):
+                        self.submit_form_with_file(instance)
+                self.assertEqual(
+                    CustomFormSubmission.objects.filter(form=instance).exists(),
+                    False,
+                )
+                self.assertEqual(
+                    os.listdir(os.path.join(media_root, "streamforms")), []
+                )
+
+    @override_settings(
+        WAGTAIL_TRANSLATABLEFORM_HOOK_TIMING_CALLBACK="tests.test.hook_timing_callback"
+    )
+    def test_form_submission_hooks_dispatch(self):
+        instance = self.get_model_instance().first()
+        prefix_hook = mock.Mock(__name__="save_customform")
+        registered = form_hooks._hooks["process_form_submission"]
+        with mock.patch.dict(
+            form_hooks._hooks,
+            {"process_form_submission": [*registered, (prefix_hook, 0)]},
+        ), mock.patch("tests.test.hook_timing_callback") as callback:
+            self.assertEqual(
+                [fn.__name__ for fn in get_submission_hooks(instance)],
+                ["save_customform_submission_data"],
+            )
+            # resolved once per form version
+            with mock.patch.object(
+                instance._meta.get_field("process_form_submission_hooks"),
+                "to_python",
+            ) as to_python:
+                get_submission_hooks(instance)
+            to_python.assert_not_called()
+            self.submit_form()
+        prefix_hook.assert_not_called()
+        callback.assert_called_once()
+        self.assertEqual(
+            callback.call_args.args[:2], (instance, "save_customform_submission_data")
+        )
+        self.assertEqual(
+            CustomFormSubmission.objects.filter(form=instance).count(), 2
+        )
+
+    def test_concurrent_form_submission_hooks(self):
+        instance = self.get_model_instance().first()
+        calls = {}
+
+        @independent_hook
+        def crm_hook(instance, form, request):
+            calls["crm_hook"] = threading.current_thread().name
+            raise ValueError("CRM is down")
+
+        async def audit_hook(instance, form, request):
+            calls["audit_hook"] = True
+
+        instance.process_form_submission_hooks = (
+            "crm_hook,audit_hook,save_customform_submission_data"
+        )
+        instance.save()
+        registered = form_hooks._hooks["process_form_submission"]
+        with mock.patch.dict(
+            form_hooks._hooks,
+            {
+                "process_form_submission": [
+                    (crm_hook, 0), (audit_hook, 0), *registered
+                ]
+            },
+        ), self.assertLogs("wagtail_translatableforms", level="ERROR"):
+            with self.assertRaises(SubmissionHooksError) as error:
+                self.submit_form()
+        self.assertEqual(list(error.exception.errors), ["crm_hook"])
+        self.assertEqual(calls["audit_hook"], True)
+        # test runs in atomic block, pool threads would not see its rows
+        self.assertEqual(calls["crm_hook"], threading.current_thread().name)
+        # save hook runs first although it is registered last
+        self.assertEqual(
+            CustomFormSubmission.objects.filter(form=instance).count(), 2
+        )
+
+    async def test_async_form_detail(self):
+        instance = await get_translatableform_model().objects.afirst()
+        response = await form_detail(AsyncRequestFactory().get("/"), pk=instance.pk)
+        self.assertEqual(json.loads(response.content)["slug"], instance.slug)
+        self.assertEqual(
+            await aserialize_form(instance.pk),
+            await sync_to_async(serialize_form)(instance.pk),
+        )
+        with self.assertRaises(Http404):
+            await form_detail(AsyncRequestFactory().get("/"), pk=0)
+
+    async def test_async_form_submit(self):
+        instance = await get_translatableform_model().objects.afirst()
+        request = AsyncRequestFactory().post(
+            "/",
+            {
+                "form_id": str(instance.pk),
+                "form_reference": "14002ec7-9efb-46ee-afef-ca9f075046877",
+                "name": "Bob",
+            },
+            headers={"X-Real-Ip": "127.0.0.1"},
+        )
+        response = await form_submit(request, pk=instance.pk)
+        self.assertEqual(response.status_code, 201)
+        submission = await CustomFormSubmission.objects.filter(form=instance).afirst()
+        self.assertEqual(submission.form_data["name"], "Bob")
+        self.assertEqual(submission.form_data["IP"], "127.0.0.1")
+        response = await form_submit(AsyncRequestFactory().post("/", {}), pk=instance.pk)
+        self.assertEqual(response.status_code, 400)
+        # overridden 'process_form_submission' is used by the API too
+        with mock.patch.object(
+            type(instance), "process_form_submission",
+        ) as process_form_submission:
+            response = await form_submit(request, pk=instance.pk)
+        self.assertEqual(response.status_code, 201)
+        process_form_submission.assert_called_once()
+
+    def test_form_detail_conditional_get(self):
+        instance = self.get_model_instance().first()
+        view = async_to_sync(form_detail)
+        response = view(AsyncRequestFactory().get("/"), pk=instance.pk)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+        with mock.patch(
+            "wagtail_translatableforms.api_views.aserialize_form",
+        ) as serialize:
+            with self.assertNumQueries(1):
+                response = view(
+                    AsyncRequestFactory().get("/", headers={"If-None-Match": etag}),
+                    pk=instance.pk,
+                )
+            serialize.assert_not_called()
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        response = view(AsyncRequestFactory().get("/", {"locale": "fr"}), slug="test")
+        self.assertEqual(
+            json.loads(response.content)["id"], self.get_fr_translation().pk,
+        )
+        self.assertNotEqual(response.headers["ETag"], etag)
+        instance.save()
+        response = view(
+            AsyncRequestFactory().get("/", headers={"If-None-Match": etag}),
+            pk=instance.pk,
+        )
+        self.assertEqual(response.status_code, 200)
+        with self.assertRaises(Http404):
+            view(AsyncRequestFactory().get("/"), slug="missing")
+        # change saved by another process, local cache entry is not served
+        with override_settings(WAGTAIL_TRANSLATABLEFORM_CACHE_ENABLED=True):
+            form_cache.clear()
+            view(AsyncRequestFactory().get("/"), pk=instance.pk)
+            get_translatableform_model().objects.filter(pk=instance.pk).update(
+                title="changed", updated_at=timezone.now() + timedelta(seconds=1),
+            )
+            response = view(AsyncRequestFactory().get("/"), pk=instance.pk)
+        self.assertEqual(json.loads(response.content)["title"], "changed")
+
+    def test_serialize_forms_in_bulk(self):
+        instance = self.get_model_instance().first()
+        other = self.create_model_instance(slug="other")
+        fr_translation = self.get_fr_translation()
+        with self.assertNumQueries(1):
+            data = serialize_forms(
+                ids=[other.pk],
+                slugs=["test"],
+                locales=["en", "fr", "de"],
+            )
+        self.assertEqual(
+            data,
+            {
+                (instance.translation_key, "en"): serialize_form(instance.pk),
+                (instance.translation_key, "fr"): serialize_form(fr_translation.pk),
+                (other.translation_key, "en"): serialize_form(other.pk),
+            },
+        )
+        self.assertEqual(
+            serialize_forms(translation_keys=[instance.translation_key]).keys(),
+            {(instance.translation_key, "en"), (instance.translation_key, "fr")},
+        )
+        view = TranslatableFormsBulkAPIView.as_view()
+        response = view(
+            RequestFactory().get(
+                "/", {"slug": ["test", "other"], "locale": ["fr"]},
+            ),
+        )
+        self.assertEqual(
+            response.data,
+            {str(instance.translation_key): {"fr": serialize_form(fr_translation.pk)}},
+        )
+        response = view(RequestFactory().get("/", {"locale": ["fr"]}))
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(WAGTAIL_TRANSLATABLEFORM_QUEUE_SUBMISSIONS=True)
+    def test_queued_form_submission(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                instance = self.create_model_instance_with_file_field()
+                self.submit_form_with_file(instance)
+                self.assertEqual(
+                    CustomFormSubmission.objects.filter(form=instance).exists(),
+                    False,
+                )
+                call_command("process_submission_queue", stdout=StringIO())
+                submission = CustomFormSubmission.objects.get(form=instance)
+                self.assertEqual(submission.get_data()["document"], "1 file")
+                submission_file = submission.files.get()
+                self.assertEqual(
+                    submission_file.file.storage.exists(submission_file.file.name),
+                    True,
+                )
+                self.assertEqual(FormSubmissionQueueItem.objects.exists(), False)
+
+    @override_settings(WAGTAIL_TRANSLATABLEFORM_FILE_UPLOAD_WORKERS=2)
+    def test_store_files_concurrently(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                submission_files = [
+                    CustomFormSubmissionFile(
+                        field="document",
+                        file=SimpleUploadedFile(f"document{i}.txt", b"content"),
+                    )
+                    for i in range(3)
+                ]
+                storage = CustomFormSubmissionFile._meta.get_field("file").storage
+                save = storage._save
+
+                def failing_save(name, content):
+                    if "document1" in name:
+                        raise OSError
+                    return save(name, content)
+
+                with mock.patch.object(storage, "_save", side_effect=failing_save):
+                    with self.assertRaises(OSError):
+                        store_files(
+                            submission_file.file
+                            for submission_file in submission_files
+                        )
+                self.assertEqual(
+                    os.listdir(os.path.join(media_root, "streamforms")), []
+                )
+                stored_files = store_files(
+                    CustomFormSubmissionFile(
+                        field="document",
+                        file=SimpleUploadedFile(f"document{i}.txt", b"content"),
+                    ).file
+                    for i in range(3)
+                )
+                self.assertEqual(len(stored_files), 3)
+                self.assertEqual(
+                    len(os.listdir(os.path.join(media_root, "streamforms"))), 3
+                )
+
+    @override_settings(WAGTAIL_TRANSLATABLEFORM_QUEUE_SUBMISSIONS=True)
+    def test_queued_form_submission_failure(self):
+        instance = self.get_model_instance().first()
+        self.submit_form()
+        items = claim_queue_items(10, timedelta(0))
+        with self.assertNumQueries(0):
+            self.assertEqual([item.form for item in items], [instance])
+        with mock.patch.object(
+            CustomFormSubmission.objects, "create", side_effect=IntegrityError
+        ), self.assertLogs("wagtail_translatableforms", level="ERROR"):
+            self.assertEqual(
+                process_submission_queue(max_attempts=2),
+                {"processed": 0, "retried": 0, "failed": 1},
+            )
+        item = FormSubmissionQueueItem.objects.get(form=instance)
+        self.assertEqual(item.status, FormSubmissionQueueItem.STATUS_FAILED)
+        self.assertEqual(item.attempts, 2)
+
+    def test_prune_submissions(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                instance = self.create_model_instance_with_file_field()
+                self.submit_form_with_file(instance)
+                self.submit_form_with_file(instance)
+                CustomFormSubmission.objects.update(
+                    submit_time=timezone.now() - timedelta(days=31)
+                )
+                call_command(
+                    "prune_submissions", days=30, dry_run=True, stdout=StringIO()
+                )
+                self.assertEqual(CustomFormSubmission.objects.count(), 3)
+                # files are removed from storage after commit of each chunk
+                with self.captureOnCommitCallbacks(execute=True):
+                    call_command(
+                        "prune_submissions",
+                        days=30,
+                        forms=["files"],
+                        batch_size=1,
+                        stdout=StringIO(),
+                    )
+                self.assertEqual(
+                    CustomFormSubmission.objects.filter(form=instance).exists(),
+                    False,
+                )
+                self.assertEqual(CustomFormSubmission.objects.count(), 1)
+                self.assertEqual(
+                    os.listdir(os.path.join(media_root, "streamforms")), []
+                )
+
+    def test_submission_files_deleted_in_batch(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                instance = self.create_model_instance_with_file_field()
+                self.submit_form_with_file(instance)
+                self.submit_form_with_file(instance)
+                storage = CustomFormSubmissionFile._meta.get_field("file").storage
+                with self.captureOnCommitCallbacks() as callbacks:
+                    CustomFormSubmission.objects.filter(form=instance).delete()
+                self.assertEqual(len(callbacks), 1)
+                self.assertEqual(
+                    len(os.listdir(os.path.join(media_root, "streamforms"))), 2
+                )
+                with mock.patch.object(
+                    storage, "delete_many", create=True
+                ) as delete_many:
+                    callbacks[0]()
+                self.assertEqual(len(delete_many.call_args.args[0]), 2)
+                callbacks[0]()
+                self.assertEqual(
+                    os.listdir(os.path.join(media_root, "streamforms")), []
+                )
+
+    def test_forms_result_list(self):
+        for i in range(3):
+            self.create_model_instance(slug=f"test-{i}")
+        forms_count = get_translatableform_model().objects.count()
+        with mock.patch.object(
+            CustomFormModelAdmin,
+            "get_list_display_add_buttons",
+            autospec=True,
+            return_value="title",
+        ) as get_list_display_add_buttons:
+            request, context = self.get_forms_index_context()
+            get_list_display_add_buttons.reset_mock()
+            # submission columns are annotated to object list
+            with self.assertNumQueries(0):
+                html = Template(
+                    "{% load custom_tags %}{% custom_result_list %}"
+                ).render(RequestContext(request, context))
+        get_list_display_add_buttons.assert_called_once()
+        self.assertEqual(html.count('<div class="title-wrapper">'), forms_count)
+        self.assertInHTML(
+            '<td class="field-latest_submission title">-</td>', html, forms_count - 1
+        )
+
+    def test_forms_index_submission_stats(self):
+        instance = self.get_model_instance().first()
+        self.submit_form()
+        submission = CustomFormSubmission.objects.filter(form=instance).first()
+        for enabled in (False, True):
+            with override_settings(WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_STATS=enabled):
+                call_command("rebuild_submission_stats", stdout=StringIO())
+                context = self.get_forms_index_context()[1]
+                form = next(
+                    form for form in context["object_list"] if form.pk == instance.pk
+                )
+                self.assertEqual(form.submissions_count, 2)
+                self.assertEqual(form.latest_submit_time, submission.submit_time)
+
+    @override_settings(WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_STATS=True)
+    def test_submission_stats(self):
+        instance = self.get_model_instance().first()
+        self.submit_form()
+        self.submit_form()
+        stats = FormSubmissionStats.objects.get(form=instance)
+        self.assertEqual(stats.count, 2)
+        submissions = list(CustomFormSubmission.objects.filter(form=instance))
+        self.assertEqual(stats.latest_submit_time, submissions[0].submit_time)
+        request = RequestFactory().post(
+            f"/?selected-submissions={submissions[0].pk}"
+        )
+        request.user = self.get_superuser()
+        request._messages = mock.Mock()
+        CustomSubmissionDeleteView.as_view()(request, pk=instance.pk)
+        stats.refresh_from_db()
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(stats.latest_submit_time, submissions[1].submit_time)
+
+    def test_translation_source_sync_skipped(self):
+        instance = self.get_model_instance().first()
+        instance.save()
+        with mock.patch.object(
+            TranslationSource, "update_or_create_from_instance"
+        ) as update_or_create_from_instance:
+            with self.captureOnCommitCallbacks(execute=True):
+                instance.process_form_submission_hooks = ""
+                instance.save()
+                instance.title = "changed"
+                instance.save(update_fields=["process_form_submission_hooks"])
+            update_or_create_from_instance.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                instance.save(update_fields=["title"])
+            update_or_create_from_instance.assert_called_once_with(instance)
+        # fingerprint is stored only after the source is updated
+        instance.title = "failed"
+        with mock.patch.object(
+            TranslationSource, "update_or_create_from_instance", side_effect=OSError,
+        ):
+            with self.assertRaises(OSError):
+                with self.captureOnCommitCallbacks(execute=True):
+                    instance.save()
+        instance.refresh_from_db()
+        self.assertNotEqual(
+            instance.translation_fingerprint,
+            get_translatable_content_fingerprint(instance),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+        instance.refresh_from_db()
+        self.assertEqual(
+            instance.translation_fingerprint,
+            get_translatable_content_fingerprint(instance),
+        )
+        # same instance saved again after translatable change
+        with mock.patch.object(
+            TranslationSource, "update_or_create_from_instance"
+        ) as update_or_create_from_instance:
+            with self.captureOnCommitCallbacks(execute=True):
+                instance.title = "synced once"
+                instance.save()
+            with self.captureOnCommitCallbacks(execute=True):
+                instance.process_form_submission_hooks = ""
+                instance.save()
+            update_or_create_from_instance.assert_called_once()
+        # full save does not write fingerprint, it is stored by sync only
+        get_translatableform_model().objects.filter(pk=instance.pk).update(
+            translation_fingerprint="synced",
+        )
+        instance.save()
+        instance.refresh_from_db()
+        self.assertEqual(instance.translation_fingerprint, "synced")
+
+    def test_translation_source_sync_coalesced(self):
+        instance = self.get_model_instance().first()
+        with mock.patch.object(
+            TranslationSource, "update_or_create_from_instance"
+        ) as update_or_create_from_instance:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                for title in ("first", "second", "third"):
+                    instance.title = title
+                    instance.save()
+            self.assertEqual(len(callbacks), 1)
+            update_or_create_from_instance.assert_called_once()
+            self.assertEqual(
+                update_or_create_from_instance.call_args.args[0].title, "third"
+            )
+            update_or_create_from_instance.reset_mock()
+            with self.captureOnCommitCallbacks(execute=True):
+                with defer_translation_source_sync():
+                    instance.title = "fourth"
+                    instance.save()
+                    instance.title = "fifth"
+                    instance.save()
+                    update_or_create_from_instance.assert_not_called()
+            update_or_create_from_instance.assert_called_once()
+
     def test_translation(self):
         self.assertEqual(
             len(get_translatableform_model().objects.all()), 2
@@ -54,8 +618,29 @@ class TranslatableModelTestCase(TestCase):
             self.check_translation(), (False, True, 4)
         )
 
+    def test_concurrent_translation(self):
+        instance = self.get_model_instance().first()
+        translation = self.get_fr_translation()
+        with mock.patch.object(
+            TranslatableMixin,
+            "get_translation",
+            side_effect=[instance.DoesNotExist, translation],
+        ):
+            self.assertEqual(
+                instance.get_translation(self.get_fr_locale_instance().first()),
+                translation,
+            )
+        # not a race, e.g. suffixed slug is taken by another form
+        locale = self.get_fr_locale_instance().first()
+        instance = self.create_model_instance(slug="test2")
+        self.create_model_instance(slug=f"test2-{locale}")
+        with self.assertRaises(IntegrityError):
+            instance.get_translation(locale)
+
     def test_translation_source_update(self):
-        self.add_field_to_model()
+        # translation source is synced after commit
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_field_to_model()
         self.assertEqual(
             self.check_translation_update(), True
         )
@@ -66,6 +651,68 @@ class TranslatableModelTestCase(TestCase):
             len(get_translatableform_model().objects.all()), 0
         )
 
+    def test_delete_translation_keeps_source(self):
+        self.get_fr_translation().delete()
+        self.assertEqual(
+            len(get_translatableform_model().objects.all()), 1
+        )
+
+    def test_delete_snippet_hook(self):
+        instance = self.get_model_instance().first()
+        http_request = HttpRequest()
+        http_request.method = "POST"
+        for fn in hooks.get_hooks("before_delete_snippet"):
+            fn(http_request, [instance])
+        self.assertEqual(
+            list(get_translatableform_model().objects.all()), [instance]
+        )
+
+    def test_create_translations(self):
+        instance = self.create_model_instance(slug="test2")
+        locale = self.get_fr_locale_instance().first()
+        self.assertEqual(
+            create_translations(
+                get_translatableform_model().objects.all(), [locale]
+            ), 1
+        )
+        translation = instance.get_translation(locale)
+        self.assertEqual(translation.slug, f"test2-{locale}")
+        source = TranslationSource.objects.get_for_instance(instance)
+        self.assertEqual(
+            Translation.objects.filter(source=source, target_locale=locale).exists(),
+            True
+        )
+
+    def test_create_translations_skips_translations(self):
+        instance = self.get_model_instance().first()
+        translation = self.get_fr_translation()
+        locale = self.get_fr_locale_instance().first()
+        self.assertEqual(
+            create_translations(
+                get_translatableform_model().objects.all(), [locale]
+            ), 0
+        )
+        self.assertEqual(
+            TranslationSource.objects.filter(
+                object_id=instance.translation_key, locale=locale,
+            ).exists(),
+            False,
+        )
+        # translation is not a source, its deletion keeps the original
+        translation.delete()
+        self.assertEqual(
+            list(get_translatableform_model().objects.all()), [instance]
+        )
+
+    def test_translate_forms_command(self):
+        self.create_model_instance(slug="test2")
+        call_command(
+            "translate_forms", locales="fr", batch_size=1, stdout=StringIO()
+        )
+        self.assertEqual(
+            len(get_translatableform_model().objects.all()), 4
+        )
+
     def test_urls(self):
         instance = self.get_model_instance().first()
         delete_form_path = reverse(
@@ -82,6 +729,12 @@ class TranslatableModelTestCase(TestCase):
         self.assertEqual(
             resolve(sibmission_form_path).func.view_class, CustomSubmissionListView
         )
+        api_urls = "wagtail_translatableforms.api_urls"
+        self.assertEqual(resolve("/api/", urlconf=api_urls).func, form_detail)
+        self.assertEqual(
+            resolve("/bulk/translations/", urlconf=api_urls).func.view_class,
+            TranslatableFormsBulkAPIView,
+        )
 
     def test_serializer(self):
         instance = self.get_model_instance().first()
@@ -104,6 +757,126 @@ class TranslatableModelTestCase(TestCase):
             'process_form_submission_hooks': 'save_customform_submission_data'}
         )
 
+    def test_prefetch_forms(self):
+        instance = self.get_model_instance().first()
+        stream_block = blocks.StreamBlock(
+            [
+                ("form", self.get_translatableform_block()),
+                ("section", blocks.StructBlock(
+                    [("forms", blocks.ListBlock(self.get_translatableform_block()))]
+                )),
+            ]
+        )
+        form_value = {"form": instance.pk, "form_title": "test"}
+        value = stream_block.to_python(
+            [
+                {"type": "form", "value": form_value},
+                {"type": "section", "value": {"forms": [form_value, form_value]}},
+            ]
+        )
+        expected = self.serialize_translatableform_instance()
+        with self.assertNumQueries(1):
+            context = prefetch_forms(value)
+        with self.assertNumQueries(0):
+            self.assertEqual(serialize_form(instance.pk, context=context), expected)
+        # stream value conversion only, one query per block type
+        with self.assertNumQueries(2):
+            representation = stream_block.get_api_representation(value)
+        self.assertEqual(representation[1]["value"]["forms"][0]["form"], expected)
+
+    @override_settings(WAGTAIL_TRANSLATABLEFORM_CACHE_ENABLED=True)
+    def test_serialized_form_cache(self):
+        instance = self.get_model_instance().first()
+        form_cache.clear()
+        serialize_form(instance.pk)
+        with self.assertNumQueries(0):
+            with mock.patch.object(form_cache, "get_version") as get_version:
+                self.assertEqual(
+                    serialize_form(instance.pk)["title"], "test"
+                )
+            # fresh local entry is served without shared cache round trip
+            get_version.assert_not_called()
+        with override_settings(WAGTAIL_TRANSLATABLEFORM_CACHE_LOCAL_TIMEOUT=-1):
+            form_cache.clear()
+            serialize_form(instance.pk)
+            with mock.patch.object(
+                form_cache.cache, "get", wraps=form_cache.cache.get,
+            ) as get:
+                self.assertEqual(serialize_form(instance.pk)["title"], "test")
+            # expired local entry is revalidated with version only
+            self.assertEqual(get.call_count, 1)
+        instance.title = "changed"
+        instance.save()
+        self.assertEqual(serialize_form(instance.pk)["title"], "changed")
+        stats = form_cache.get_stats()
+        self.assertGreaterEqual(stats["local_hits"], 1)
+        self.assertGreaterEqual(stats["misses"], 2)
+
+    def test_unique_fields_names(self):
+        self.assertEqual(get_unique_fields_names(), {"slug"})
+        self.assertEqual(
+            get_unique_fields_names(), get_unique_fields_names_from_source()
+        )
+
+    def test_backfill_fields_data(self):
+        instance = self.get_model_instance().first()
+        fields_data = instance.fields_data
+        self.assertEqual(fields_data[0]["slug"], "name")
+        get_translatableform_model().objects.update(fields_data=[])
+        call_command("backfill_fields_data", batch_size=1, stdout=StringIO())
+        instance.refresh_from_db()
+        self.assertEqual(instance.fields_data, fields_data)
+
+    def test_submissions_keyset_pagination(self):
+        instance = self.get_model_instance().first()
+        for _ in range(4):
+            self.submit_form()
+        pages = []
+        params = {}
+        with mock.patch.object(CustomSubmissionListView, "paginate_by", 2):
+            while True:
+                response = self.get_submissions_list(instance, params)
+                page = response.context_data["page_obj"]
+                pages.append([submission.pk for submission in page])
+                if not page.has_next():
+                    break
+                params = {"after": page.next_cursor}
+            response = self.get_submissions_list(
+                instance, {"before": page.previous_cursor}
+            )
+        self.assertEqual(
+            [pk for page in pages for pk in page],
+            list(
+                CustomFormSubmission.objects.filter(form=instance).values_list(
+                    "pk", flat=True
+                )
+            ),
+        )
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(
+            [submission.pk for submission in response.context_data["page_obj"]],
+            pages[1],
+        )
+        self.assertEqual(response.context_data["submissions_count"], 5)
+
+    def test_submissions_export(self):
+        instance = self.get_model_instance().first()
+        response = self.get_submissions_export(instance, {"format": "csv"})
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(rows[0], "Submission date,name,IP,Files")
+        self.assertEqual(rows[1].split(",")[1:], ["Alise", "-", ""])
+        # 'Download CSV' action keeps its columns
+        response = self.get_submissions_list(instance, {"action": "CSV"})
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(rows[0], "Submission date,name,IP")
+        response = self.get_submissions_export(instance, {"format": "ndjson"})
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            {key: value for key, value in json.loads(rows[0]).items()
+             if key != "submit_time"},
+            {"name": "Alise", "IP": "-", "files": []},
+        )
+
     def test_traslatableform_block(self):
         instance = self.get_model_instance().first()
         form_block = self.get_translatableform_block()
@@ -114,11 +887,11 @@ class TranslatableModelTestCase(TestCase):
                 }
             )
 
-    def create_model_instance(self):
+    def create_model_instance(self, slug="test"):
         en_locale = self.get_locale_model().objects.get(language_code="en")
-        get_translatableform_model().objects.create(
+        return get_translatableform_model().objects.create(
             title="test",
-            slug="test",
+            slug=slug,
             template_name="streamforms/form_block.html",
             process_form_submission_hooks="save_customform_submission_data",
             locale=en_locale,
@@ -145,6 +918,13 @@ class TranslatableModelTestCase(TestCase):
     def get_fr_locale_instance(self):
         return self.get_locale_model().objects.filter(language_code="fr")
 
+    def get_fr_translation(self):
+        instance = self.get_model_instance().first()
+        return get_translatableform_model().objects.get(
+            translation_key=instance.translation_key,
+            locale=self.get_fr_locale_instance().first(),
+        )
+
     def get_model_instance(self):
         return get_translatableform_model().objects.filter(slug="test")
 
@@ -190,6 +970,62 @@ class TranslatableModelTestCase(TestCase):
             return
         raise FormNotValidError("Form not valid!")
 
+    def create_model_instance_with_file_field(self):
+        instance = self.create_model_instance(slug="files")
+        instance.fields = [
+            {
+                "id": "c5e8b87e-6c4e-4c5e-9f43-5f1a3b0e9a11",
+                "type": "singlefile",
+                "value": {
+                    "label": "document",
+                    "required": True,
+                    "help_text": "",
+                }
+            }
+        ]
+        instance.save()
+        return instance
+
+    def submit_form_with_file(self, instance):
+        data = {
+            "form_id": str(instance.pk),
+            "form_reference": "14002ec7-9efb-46ee-afef-ca9f075046877",
+        }
+        files = MultiValueDict(
+            {"document": [SimpleUploadedFile("document.txt", b"content")]}
+        )
+        http_request = HttpRequest()
+        request = Request(http_request)
+        form = instance.get_form(data, files, user=request.user)
+        if form.is_valid():
+            instance.process_form_submission(form, request)
+            return
+        raise FormNotValidError("Form not valid!")
+
+    def get_superuser(self):
+        return get_user_model().objects.get_or_create(
+            username="admin", defaults={"is_superuser": True, "is_staff": True}
+        )[0]
+
+    def get_forms_index_context(self):
+        request = RequestFactory().get("/")
+        request.user = self.get_superuser()
+        response = CustomFormModelAdmin().index_view(request)
+        return request, {
+            "view": response.context_data["view"],
+            "object_list": list(response.context_data["object_list"]),
+        }
+
+    def get_submissions_list(self, instance, params):
+        request = RequestFactory().get("/", params)
+        request.user = self.get_superuser()
+        return CustomSubmissionListView.as_view()(request, pk=instance.pk)
+
+    def get_submissions_export(self, instance, params):
+        request = RequestFactory().get("/", params)
+        request.user = self.get_superuser()
+        return CustomSubmissionExportView.as_view()(request, pk=instance.pk)
+
     def get_form_submission(self):
         instance = self.get_model_instance().first()
         return CustomFormSubmission.objects.get(form=instance)
@@ -0,0 +1,17 @@
+from django.urls import path
+
+from .api_views import TranslatableFormsBulkAPIView, form_detail, form_submit
+
+app_name = "wagtail_translatableforms_api"
+
+urlpatterns = [
+    path("<int:pk>/", form_detail, name="form_detail"),
+    path("<int:pk>/submissions/", form_submit, name="form_submit"),
+    path("<str:slug>/", form_detail, name="form_detail_by_slug"),
+    # two segments, does not clash with form slugs
+    path(
+        "bulk/translations/",
+        TranslatableFormsBulkAPIView.as_view(),
+        name="forms_bulk_api",
+    ),
+]
@@ -0,0 +1,115 @@
+import hashlib
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .serializers import (
+    FormsBulkQuerySerializer,
+    TranslatableFormSerializer,
+    aget_form,
+    aserialize_form,
+    get_form_queryset,
+    serialize_forms,
+)
+from .submissions import aprocess_form_submission
+
+FORM_VALIDATORS_FIELDS = ("pk", "locale_id", "updated_at", "translation_fingerprint")
+
+
+async def form_detail(request, pk=None, slug=None):
+    """
+    Returns serialized form by id or slug, '?locale=' returns its translation,
+    form is fetched with async ORM. Responses carry ETag and Last-Modified,
+    conditional requests are answered with 304 using one narrow query,
+    form is not serialized.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    validators = await get_form_queryset(
+        pk, slug, request.GET.get("locale"),
+    ).values(*FORM_VALIDATORS_FIELDS).afirst()
+    if validators is None:
+        raise Http404
+    etag = get_form_etag(validators)
+    last_modified = int(validators["updated_at"].timestamp())
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified,
+    )
+    if response is None:
+        try:
+            # cached body is tied to the validators, not served stale under new ETag
+            data = await aserialize_form(validators["pk"], version=etag.strip('"'))
+        except ObjectDoesNotExist:
+            # deleted after validators were read
+            raise Http404
+        response = JsonResponse(data)
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+async def form_submit(request, pk):
+    """Validates posted form data and processes the submission with async ORM."""
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+    try:
+        instance = await aget_form(pk)
+    except ObjectDoesNotExist:
+        raise Http404
+    form = instance.get_form(request.POST, request.FILES)
+    if not form.is_valid():
+        return JsonResponse({"errors": form.errors}, status=400)
+    await aprocess_form_submission(instance, form, request)
+    return JsonResponse({"message": instance.success_message}, status=201)
+
+
+def get_form_etag(validators, serializer=TranslatableFormSerializer):
+    """Returns strong ETag of the form from values of 'FORM_VALIDATORS_FIELDS'."""
+    value = ":".join(
+        (
+            str(validators["pk"]),
+            str(validators["locale_id"]),
+            validators["updated_at"].isoformat(),
+            validators["translation_fingerprint"],
+            f"{serializer.__module__}.{serializer.__qualname__}",
+        ),
+    )
+    return quote_etag(hashlib.sha1(value.encode()).hexdigest())
+
+
+class TranslatableFormsBulkAPIView(APIView):
+    """
+    Read-only forms by repeated 'id', 'slug' or 'translation_key'
+    params in 'locale' params, fetched with one query. Returns
+    {translation_key: {language_code: form}}.
+    """
+
+    permission_classes = [AllowAny]
+    renderer_classes = [JSONRenderer]
+    serializer_class = TranslatableFormSerializer
+
+    @extend_schema(
+        parameters=[FormsBulkQuerySerializer],
+        responses=OpenApiTypes.OBJECT,
+    )
+    def get(self, request):
+        query = FormsBulkQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        data = {}
+        for (translation_key, locale), form_data in serialize_forms(
+            query.validated_data.get("id", ()),
+            query.validated_data.get("slug", ()),
+            query.validated_data.get("translation_key", ()),
+            query.validated_data.get("locale") or None,
+            self.serializer_class,
+        ).items():
+            data.setdefault(str(translation_key), {})[locale] = form_data
+        return Response(data)
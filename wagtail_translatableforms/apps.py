@@ -39,47 +39,56 @@ class StreamsConfig(AppConfig):
 
         super().ready()
 
-        from json import dumps, loads
-
         from django.db import transaction
-        from django.template.defaultfilters import pluralize
+        from django.db.models.signals import post_delete
         from django.urls import include, path
         from wagtail import hooks
         from wagtailstreamforms.hooks import register
-        from wagtailstreamforms.serializers import FormSubmissionSerializer
 
         from . import get_translatableform_model
-        from .models import CustomFormSubmissionFile
+        from .file_uploads import delete_stored_files, store_files
+        from .models import CustomFormSubmissionFile, invalidate_serialized_form
+        from .submission_hooks import async_counterpart
+        from .submission_stats import record_submission
+        from .submissions import (
+            asave_customform_submission_data,
+            get_submission_data,
+            get_submission_files,
+        )
         from .urls import urlpatterns
-        from .utils import get_translation_source_content
+        from .utils import get_source_translation_keys
 
+        post_delete.connect(
+            invalidate_serialized_form,
+            sender=get_translatableform_model(),
+        )
 
         @register('process_form_submission')
+        @async_counterpart(asave_customform_submission_data)
         def save_customform_submission_data(instance, form, request):
             """ saves the form submission data """
 
-            # copy the cleaned_data so we dont mess with the original
-            submission_data = form.cleaned_data.copy()
-            submission_data["IP"] = request.headers.get("X-Real-Ip", "-")
-            # change the submission data to a count of the files
-            for field in form.files.keys():
-                count = len(form.files.getlist(field))
-                submission_data[field] = '{} file{}'.format(count, pluralize(count))
-
-            # save the submission data
-            submission = instance.get_submission_class().objects.create(
-                form_data=dumps(submission_data, cls=FormSubmissionSerializer),
-                form=instance
+            submission_data = get_submission_data(form, request)
+            submission_files = get_submission_files(form)
+            # write the form files to storage before the transaction,
+            # files of queued submissions are already in storage
+            stored_files = store_files(
+                submission_file.file for submission_file in submission_files
             )
-
-            # save the form files
-            for field in form.files:
-                for file in form.files.getlist(field):
-                    CustomFormSubmissionFile.objects.create(
-                        submission=submission,
-                        field=field,
-                        file=file
+            try:
+                # save the submission data and the form files in one transaction
+                with transaction.atomic():
+                    submission = instance.get_submission_class().objects.create(
+                        form_data=submission_data,
+                        form=instance
                     )
+                    for submission_file in submission_files:
+                        submission_file.submission = submission
+                    CustomFormSubmissionFile.objects.bulk_create(submission_files)
+                    record_submission(submission)
+            except Exception:
+                delete_stored_files(stored_files)
+                raise
 
         @hooks.register("register_admin_urls")
         def register_admin_urls():
@@ -101,21 +110,15 @@ class StreamsConfig(AppConfig):
         @hooks.register("before_delete_snippet")
         def delete_related_translatebleform(request, instances):
             if request.method == "POST":
-                content = get_translation_source_content()
-                for instance in instances:
-                    if isinstance(instance, get_translatableform_model()):
-                        filtered = list(
-                            filter(
-                                lambda x: (tmp := loads(x))["pk"] == instance.pk
-                                and tmp["translation_key"]
-                                == str(instance.translation_key),
-                                content,
-                            ),
-                        )
-                        if filtered:
-                            related_snippets = instance.__class__.objects.filter(
-                                translation_key=instance.translation_key,
-                            )
-                            with transaction.atomic():
-                                for ele in related_snippets:
-                                    ele.delete()
\ No newline at end of file
+                model = get_translatableform_model()
+                forms = [
+                    instance for instance in instances if isinstance(instance, model)
+                ]
+                translation_keys = get_source_translation_keys(forms)
+                if translation_keys:
+                    with transaction.atomic():
+                        model.objects.filter(
+                            translation_key__in=translation_keys,
+                        ).exclude(
+                            pk__in=[form.pk for form in forms],
+                        ).delete()
@@ -4,7 +4,7 @@ from wagtail.snippets.blocks import SnippetChooserBlock
 from wagtailstreamforms.blocks import WagtailFormBlock
 
 from . import get_translatableform_model
-from .serializers import TranslatableFormSerializer
+from .serializers import serialize_form_instance
 
 
 class TranslatableFormBlock(WagtailFormBlock):
@@ -27,11 +27,9 @@ class TranslatableFormBlock(WagtailFormBlock):
 
     def get_api_representation(self, value, context=None):
         representation = self.get_prep_value(value)
-        form_pk = representation.get("form")
-        if form_pk:
-            form_instance = get_translatableform_model().objects.get(pk=form_pk)
-            form_serializer = TranslatableFormSerializer(form_instance)
-            representation["form"] = form_serializer.data
+        # form instance is already fetched by the block value conversion
+        if form := value.get("form"):
+            representation["form"] = serialize_form_instance(form)
         return representation
 
     class Meta:
@@ -0,0 +1,214 @@
+import time
+from collections import Counter, OrderedDict
+from copy import deepcopy
+from threading import Lock
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.translation import get_language
+
+
+class SerializedFormCache:
+    """
+    Two tier cache of serialized forms: in-process LRU in front of
+    Django cache framework. Each form has a version stored in Django
+    cache, it is changed on form invalidation so entries of the
+    previous version are never hit again by any process. Local entries
+    keep their version and are served without shared cache round trip
+    for local timeout, other processes see invalidation after it.
+    """
+
+    key_prefix = "wagtail_translatableforms"
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._stats = Counter()
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_CACHE_ENABLED", False)
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, "WAGTAIL_TRANSLATABLEFORM_CACHE_ALIAS", "default")]
+
+    @property
+    def timeout(self):
+        return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_CACHE_TIMEOUT", 300)
+
+    @property
+    def local_timeout(self):
+        return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_CACHE_LOCAL_TIMEOUT", 5)
+
+    @property
+    def max_entries(self):
+        return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_CACHE_MAX_ENTRIES", 256)
+
+    def get_version_key(self, form_pk):
+        return f"{self.key_prefix}:version:{form_pk}"
+
+    def get_version(self, form_pk):
+        version_key = self.get_version_key(form_pk)
+        version = self.cache.get(version_key)
+        if version is None:
+            self.cache.add(version_key, uuid4().hex, None)
+            version = self.cache.get(version_key)
+        return version
+
+    async def aget_version(self, form_pk):
+        version_key = self.get_version_key(form_pk)
+        version = await self.cache.aget(version_key)
+        if version is None:
+            await self.cache.aadd(version_key, uuid4().hex, None)
+            version = await self.cache.aget(version_key)
+        return version
+
+    def get_local_key(self, form_pk, serializer):
+        return ":".join(
+            (
+                self.key_prefix,
+                "form",
+                str(form_pk),
+                get_language() or "",
+                f"{serializer.__module__}.{serializer.__qualname__}",
+            ),
+        )
+
+    def get_key(self, form_pk, serializer, version=None):
+        return ":".join(
+            (
+                self.key_prefix,
+                "form",
+                str(form_pk),
+                get_language() or "",
+                version or self.get_version(form_pk),
+                f"{serializer.__module__}.{serializer.__qualname__}",
+            ),
+        )
+
+    def get_or_set(self, form_pk, serializer, serialize, version=None):
+        """
+        Returns cached serialized form, 'serialize' callable
+        is used to get and cache it on miss. Local entries younger than
+        local timeout are returned without reading version from shared cache.
+        If 'version' is passed (e.g. built from form 'updated_at'), only
+        entries of this version are returned.
+        """
+        if not self.enabled:
+            return serialize()
+        local_key = self.get_local_key(form_pk, serializer)
+        if version is None:
+            data = self._get_local(local_key)
+            if data is not None:
+                return data
+            version = self.get_version(form_pk)
+        data = self._get_local(local_key, version)
+        if data is not None:
+            return data
+        key = self.get_key(form_pk, serializer, version)
+        data = self.cache.get(key)
+        if data is not None:
+            self._incr("hits")
+        else:
+            self._incr("misses")
+            data = serialize()
+            self.cache.set(key, data, self.timeout)
+        self._set_local(local_key, version, data)
+        return deepcopy(data)
+
+    async def aget_or_set(self, form_pk, serializer, serialize, version=None):
+        """Async 'get_or_set', 'serialize' is a coroutine function."""
+        if not self.enabled:
+            return await serialize()
+        local_key = self.get_local_key(form_pk, serializer)
+        if version is None:
+            data = self._get_local(local_key)
+            if data is not None:
+                return data
+            version = await self.aget_version(form_pk)
+        data = self._get_local(local_key, version)
+        if data is not None:
+            return data
+        key = self.get_key(form_pk, serializer, version)
+        data = await self.cache.aget(key)
+        if data is not None:
+            self._incr("hits")
+        else:
+            self._incr("misses")
+            data = await serialize()
+            await self.cache.aset(key, data, self.timeout)
+        self._set_local(local_key, version, data)
+        return deepcopy(data)
+
+    def _incr(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _get_local(self, key, version=None):
+        """
+        Returns copy of local entry if it is fresh, or if it has
+        the passed version, then it is fresh for local timeout again.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_version, expires, data = entry
+            if version is None:
+                if expires < time.monotonic():
+                    return None
+            elif version == entry_version:
+                self._entries[key] = (
+                    entry_version, time.monotonic() + self.local_timeout, data,
+                )
+            else:
+                return None
+            self._entries.move_to_end(key)
+            self._stats["local_hits"] += 1
+            return deepcopy(data)
+
+    def _set_local(self, key, version, data):
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.local_timeout, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, form_pk):
+        """
+        Changes version of the form, repeated after commit
+        so entries cached during transaction are dropped too.
+        """
+        if not self.enabled:
+            return
+        self._invalidate(form_pk)
+        transaction.on_commit(lambda: self._invalidate(form_pk))
+
+    def _invalidate(self, form_pk):
+        self.cache.set(self.get_version_key(form_pk), uuid4().hex, None)
+        key_prefix = f"{self.key_prefix}:form:{form_pk}:"
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(key_prefix)]:
+                del self._entries[key]
+            self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """Returns hits/misses counters, e.g. for metrics export."""
+        with self._lock:
+            return {
+                "local_hits": self._stats["local_hits"],
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "invalidations": self._stats["invalidations"],
+                "local_entries": len(self._entries),
+            }
+
+
+form_cache = SerializedFormCache()
@@ -0,0 +1,28 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_workers(setting, default=0):
+    """Number of threads from 'setting', 0 means work runs in calling thread."""
+    return getattr(settings, setting, default)
+
+
+def get_executor(name, setting, default=0):
+    """
+    Returns thread pool 'name' shared by the process, built on first use
+    with number of threads from 'setting' (rebuilt if the setting changes).
+    """
+    max_workers = get_workers(setting, default)
+    with _executors_lock:
+        executor = _executors.get((name, max_workers))
+        if executor is None:
+            executor = _executors[(name, max_workers)] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"wagtail_translatableforms_{name}",
+            )
+        return executor
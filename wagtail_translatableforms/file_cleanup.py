@@ -0,0 +1,99 @@
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import wait
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from . import executors
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+WORKERS_SETTING = "WAGTAIL_TRANSLATABLEFORM_FILE_DELETE_WORKERS"
+
+
+def get_workers():
+    """Number of threads deleting files, 0 deletes files in calling thread."""
+    return executors.get_workers(WORKERS_SETTING)
+
+
+def get_executor():
+    return executors.get_executor("file_delete", WORKERS_SETTING)
+
+
+def get_retries():
+    return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_FILE_DELETE_RETRIES", 3)
+
+
+def _delete(storage, names):
+    """
+    Deletes files with storage bulk API ('delete_many') if it is available,
+    one by one otherwise. Failed deletion is retried with growing delay.
+    """
+    retries = get_retries()
+    for attempt in range(retries + 1):
+        try:
+            if hasattr(storage, "delete_many"):
+                storage.delete_many(names)
+            else:
+                for name in names:
+                    storage.delete(name)
+            return
+        except Exception:
+            if attempt == retries:
+                logger.exception("Failed to delete submission files %s", names)
+                return
+            time.sleep(2**attempt / 10)
+
+
+def submit_file_deletion(storage, names):
+    """Deletes files as one task on the thread pool, returns futures."""
+    names = list(names)
+    if not names:
+        return []
+    if not get_workers():
+        _delete(storage, names)
+        return []
+    return [get_executor().submit(_delete, storage, names)]
+
+
+def delete_files(storage, names):
+    """Deletes files on the thread pool and waits for it."""
+    wait(submit_file_deletion(storage, names))
+
+
+class FileDeletionBatch:
+    """Files deleted in one transaction, removed from storage after commit."""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.names = set()
+
+    def __call__(self):
+        submit_file_deletion(self.storage, self.names)
+
+
+def schedule_file_deletion(storage, name, using=DEFAULT_DB_ALIAS):
+    """
+    Adds file to deletion batch of the current transaction (or savepoint),
+    the batch is deleted from storage on the thread pool after commit.
+    Batch is referenced only by its on_commit callback, so it is dropped
+    together with the callback when transaction is rolled back.
+    """
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        submit_file_deletion(storage, [name])
+        return
+    batches = getattr(_local, "batches", None)
+    if batches is None:
+        batches = _local.batches = weakref.WeakValueDictionary()
+    key = (using, id(storage), tuple(connection.savepoint_ids))
+    batch = batches.get(key)
+    if batch is None:
+        batch = batches[key] = FileDeletionBatch(storage)
+        transaction.on_commit(batch, using=using)
+    batch.names.add(name)
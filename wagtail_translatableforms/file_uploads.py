@@ -0,0 +1,61 @@
+from concurrent.futures import wait
+
+from . import executors
+
+WORKERS_SETTING = "WAGTAIL_TRANSLATABLEFORM_FILE_UPLOAD_WORKERS"
+
+
+def get_workers():
+    """Number of threads writing uploaded files, 0 writes files one by one."""
+    return executors.get_workers(WORKERS_SETTING)
+
+
+def get_executor():
+    return executors.get_executor("file_upload", WORKERS_SETTING)
+
+
+def _store(field_file):
+    # uploaded file is passed as is, storage reads it with 'chunks()'
+    # so temporary uploads are streamed and not loaded into memory
+    field_file.save(field_file.name, field_file.file, save=False)
+    return field_file
+
+
+def store_files(field_files):
+    """
+    Writes uncommitted files to storage, concurrently if upload workers
+    are set. Returns stored files. If any write fails, files stored by
+    the call are deleted and the first error is raised.
+    """
+    field_files = [
+        field_file for field_file in field_files if not field_file._committed
+    ]
+    stored_files = []
+    error = None
+    if get_workers() and len(field_files) > 1:
+        futures = [
+            get_executor().submit(_store, field_file) for field_file in field_files
+        ]
+        wait(futures)
+        for future in futures:
+            if future.exception() is None:
+                stored_files.append(future.result())
+            elif error is None:
+                error = future.exception()
+    else:
+        for field_file in field_files:
+            try:
+                stored_files.append(_store(field_file))
+            except Exception as exc:
+                error = exc
+                break
+    if error is not None:
+        delete_stored_files(stored_files)
+        raise error
+    return stored_files
+
+
+def delete_stored_files(field_files):
+    """Removes files written by 'store_files', e.g. when saving rows failed."""
+    for field_file in field_files:
+        field_file.delete(save=False)
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from ... import get_translatableform_model
+from ...utils import backfill_fields_data
+
+
+class Command(BaseCommand):
+    help = "Stores fields schema of existing translatable forms."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of forms updated in one chunk.",
+        )
+
+    def handle(self, *args, **options):
+        updated = backfill_fields_data(
+            get_translatableform_model(),
+            options["batch_size"],
+        )
+        self.stdout.write(f"Updated {updated} forms.")
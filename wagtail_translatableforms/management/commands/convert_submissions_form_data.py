@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ...models import CustomFormSubmission
+from ...utils import convert_submissions_form_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves text form data of existing submissions to JSON 'form_data' column. "
+        "Can be interrupted and run again, converted submissions are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of submissions converted in one transaction.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            help="Primary key of the last converted submission to resume from.",
+        )
+        parser.add_argument(
+            "--gin-index",
+            action="store_true",
+            help="Create GIN index on 'form_data' concurrently (PostgreSQL only).",
+        )
+
+    def handle(self, *args, **options):
+        if options["gin_index"] and connection.vendor != "postgresql":
+            raise CommandError("GIN index is supported on PostgreSQL only.")
+
+        started = time.monotonic()
+        converted = 0
+        for count, last_pk in convert_submissions_form_data(
+            CustomFormSubmission,
+            options["batch_size"],
+            options["start_after"],
+        ):
+            converted += count
+            self.stdout.write(
+                f"Converted {converted} submissions, last pk {last_pk} "
+                f"({converted / (time.monotonic() - started):.0f} rows/s)."
+            )
+        self.stdout.write(f"Converted {converted} submissions.")
+
+        if options["gin_index"]:
+            table = CustomFormSubmission._meta.db_table
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {table}_form_data_gin "
+                    f"ON {table} USING gin (form_data jsonb_path_ops)"
+                )
+            self.stdout.write("GIN index created.")
@@ -0,0 +1,74 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from ...submission_queue import process_submission_queue
+
+
+class Command(BaseCommand):
+    help = "Processes queued form submissions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of submissions claimed at once.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of threads processing submissions.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=5,
+            help="Number of attempts before submission is marked as failed.",
+        )
+        parser.add_argument(
+            "--retry-delay",
+            type=int,
+            default=60,
+            help="Delay in seconds before failed submission is retried, "
+            "multiplied by number of attempts.",
+        )
+        parser.add_argument(
+            "--lock-timeout",
+            type=int,
+            default=600,
+            help="Seconds after which submission left processing is claimed again.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue instead of exiting when it is drained.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1,
+            help="Seconds to wait between polls in loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.monotonic()
+            stats = process_submission_queue(
+                batch_size=options["batch_size"],
+                concurrency=options["concurrency"],
+                max_attempts=options["max_attempts"],
+                retry_delay=timedelta(seconds=options["retry_delay"]),
+                lock_timeout=timedelta(seconds=options["lock_timeout"]),
+            )
+            elapsed = time.monotonic() - started
+            if any(stats.values()):
+                self.stdout.write(
+                    "Processed {processed}, retried {retried}, failed {failed} "
+                    "submissions in {elapsed:.2f}s.".format(elapsed=elapsed, **stats)
+                )
+            if not options["loop"]:
+                return
+            time.sleep(options["sleep"])
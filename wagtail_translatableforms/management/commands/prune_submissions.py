@@ -0,0 +1,84 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ... import get_translatableform_model
+from ...operations import prune_submissions
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes form submissions older than retention period. "
+        "Retention is set with '--days' or WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_RETENTION_DAYS, "
+        "WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_RETENTION_DAYS_PER_FORM overrides it by form slug."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Retention period in days for all forms.",
+        )
+        parser.add_argument(
+            "--form",
+            action="append",
+            dest="forms",
+            help="Slug of the form to prune, can be repeated. Default to all forms.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of submissions deleted in one transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report number of submissions to delete.",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days is None:
+            days = getattr(
+                settings, "WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_RETENTION_DAYS", None
+            )
+        days_per_form = getattr(
+            settings, "WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_RETENTION_DAYS_PER_FORM", {}
+        )
+        if days is None and not days_per_form:
+            raise CommandError("Retention period is not set.")
+
+        forms = get_translatableform_model().objects.order_by("pk")
+        if options["forms"]:
+            forms = forms.filter(slug__in=options["forms"])
+
+        now = timezone.now()
+        started = time.monotonic()
+        total_submissions = total_files = 0
+        for form in forms:
+            form_days = days_per_form.get(form.slug, days)
+            if form_days is None:
+                continue
+            for submissions, files in prune_submissions(
+                form,
+                now - timedelta(days=form_days),
+                options["batch_size"],
+                options["dry_run"],
+            ):
+                total_submissions += submissions
+                total_files += files
+                elapsed = time.monotonic() - started
+                self.stdout.write(
+                    f"{form.slug}: {submissions} submissions, {files} files "
+                    f"({total_submissions / elapsed if elapsed else 0:.0f} submissions/s)."
+                )
+
+        action = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            f"{action} {total_submissions} submissions and {total_files} files "
+            f"in {time.monotonic() - started:.2f}s."
+        )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...submission_stats import rebuild_submission_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recounts denormalized submissions stats of all forms, "
+        "run it after enabling WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_STATS."
+    )
+
+    def handle(self, *args, **options):
+        rebuild_submission_stats()
+        self.stdout.write("Submission stats rebuilt.")
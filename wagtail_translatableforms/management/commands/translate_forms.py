@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+from wagtail.models import Locale
+
+from ... import get_translatableform_model
+from ...operations import create_translations
+
+
+class Command(BaseCommand):
+    help = "Creates missing translations of translatable forms into the locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--locales",
+            required=True,
+            help="Comma separated language codes of target locales, e.g. 'fr,de'.",
+        )
+        parser.add_argument(
+            "--source-locale",
+            help="Language code of forms to translate. Default to default locale.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of forms created in one batch.",
+        )
+
+    def handle(self, *args, **options):
+        language_codes = {
+            code.strip() for code in options["locales"].split(",") if code.strip()
+        }
+        locales = list(Locale.objects.filter(language_code__in=language_codes))
+        missing = language_codes - {locale.language_code for locale in locales}
+        if missing:
+            raise CommandError(f"Unknown locales: {', '.join(sorted(missing))}")
+
+        if options["source_locale"]:
+            try:
+                source_locale = Locale.objects.get(
+                    language_code=options["source_locale"],
+                )
+            except Locale.DoesNotExist:
+                raise CommandError(
+                    f"Unknown locale: {options['source_locale']}"
+                )
+        else:
+            source_locale = Locale.get_default()
+
+        forms = get_translatableform_model().objects.filter(
+            locale=source_locale,
+        ).order_by("pk")
+        created = create_translations(forms, locales, options["batch_size"])
+        self.stdout.write(f"Created {created} translations.")
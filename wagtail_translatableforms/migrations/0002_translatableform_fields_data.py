@@ -0,0 +1,43 @@
+from django.db import migrations, models
+from django.utils.text import slugify
+from unidecode import unidecode
+
+
+# frozen copy of 'utils.backfill_fields_data', which may change with the model
+def forwards(apps, schema_editor):
+    model = apps.get_model("wagtail_translatableforms", "TranslatableForm")
+    last_pk = None
+    while True:
+        queryset = model.objects.order_by("pk").only("pk", "fields")
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        batch = list(queryset[:500])
+        if not batch:
+            return
+        for form in batch:
+            form.fields_data = [
+                {
+                    "slug": str(slugify(str(unidecode(ele["value"].get("label", ""))))),
+                    "type": ele["type"],
+                    **ele["value"],
+                }
+                for ele in form.fields.raw_data
+            ]
+        model.objects.bulk_update(batch, ["fields_data"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_translatableforms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translatableform',
+            name='fields_data',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='Fields data'),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_translatableforms', '0002_translatableform_fields_data'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormSubmissionQueueItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payload', models.JSONField(verbose_name='Payload')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Available at')),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='wagtail_translatableforms.translatableform', verbose_name='TranslatableForm')),
+            ],
+            options={
+                'verbose_name': 'Form submission queue item',
+                'ordering': ['pk'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='wagtail_tra_status_117edb_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+import wagtailstreamforms.serializers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_translatableforms', '0003_formsubmissionqueueitem'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='customformsubmission',
+            old_name='form_data',
+            new_name='form_data_text',
+        ),
+        migrations.AlterField(
+            model_name='customformsubmission',
+            name='form_data_text',
+            field=models.TextField(blank=True, verbose_name='Form data (text)'),
+        ),
+        migrations.AddField(
+            model_name='customformsubmission',
+            name='form_data',
+            field=models.JSONField(encoder=wagtailstreamforms.serializers.FormSubmissionSerializer, null=True, verbose_name='Form data'),
+        ),
+    ]
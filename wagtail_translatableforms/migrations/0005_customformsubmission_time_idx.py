@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_translatableforms', '0004_customformsubmission_form_data_json'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='customformsubmission',
+            options={'ordering': ['-submit_time', '-id'], 'verbose_name': 'Form submission'},
+        ),
+        migrations.AddIndex(
+            model_name='customformsubmission',
+            index=models.Index(fields=['form', '-submit_time', '-id'], name='customformsubmission_time_idx'),
+        ),
+    ]
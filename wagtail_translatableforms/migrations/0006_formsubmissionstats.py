@@ -0,0 +1,23 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_translatableforms', '0005_customformsubmission_time_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormSubmissionStats',
+            fields=[
+                ('form', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='submission_stats', serialize=False, to='wagtail_translatableforms.translatableform', verbose_name='TranslatableForm')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Submissions count')),
+                ('latest_submit_time', models.DateTimeField(null=True, verbose_name='Latest submit time')),
+            ],
+            options={
+                'verbose_name': 'Form submission stats',
+            },
+        ),
+    ]
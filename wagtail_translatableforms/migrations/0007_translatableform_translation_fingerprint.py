@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wagtail_translatableforms', '0006_formsubmissionstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translatableform',
+            name='translation_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=40, verbose_name='Translation fingerprint'),
+        ),
+    ]
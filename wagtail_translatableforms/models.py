@@ -1,33 +1,59 @@
-from json import loads
+from json import dumps, loads
 from uuid import uuid4
 
 from django.conf import settings
 from django.db import models
-from django.db import transaction
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
 from django.db.models.signals import post_delete
+from django.utils import timezone
 from wagtail.models import TranslatableMixin
-from wagtail_localize.models import TranslationSource
-from wagtailstreamforms import hooks
 from wagtailstreamforms.models.form import AbstractForm
+from wagtailstreamforms.serializers import FormSubmissionSerializer
 from wagtailstreamforms.utils.loading import get_advanced_settings_model
 
 from . import get_translatableform_model_string, get_translatableform_model
-from .utils import get_translation_source_content, get_unique_fields_names
+from .cache import form_cache
+from .file_cleanup import schedule_file_deletion
+from .submission_hooks import run_submission_hooks
+from .translation_sync import schedule_translation_source_sync
+from .utils import (
+    get_fields_data,
+    get_translatable_content_fingerprint,
+    get_translatable_fields_names,
+    get_unique_fields_names,
+    is_translation_source,
+)
 
 
 class CustomTranslatableMixin(TranslatableMixin):
+    def copy_for_translation_with_unique_fields(self, locale):
+        """
+        Creates unsaved copy of the instance with the specified locale,
+        unique string fields are suffixed with the locale.
+        """
+        obj_copy = self.copy_for_translation(locale)
+        for field in get_unique_fields_names(self.__class__):
+            value = getattr(obj_copy, field)
+            if type(value) is not str:
+                continue
+            setattr(obj_copy, field, f"{value}-{str(locale)}")
+        return obj_copy
+
     def get_translation(self, locale):
         try:
             return super().get_translation(locale)
         except self.DoesNotExist:
-            obj_copy = self.copy_for_translation(locale)
-            for field in get_unique_fields_names():
-                value = getattr(obj_copy, field)
-                if type(value) is not str:
-                    continue
-                setattr(obj_copy, field, f"{value}-{str(locale)}")
-                obj_copy.save()
-            return super().get_translation(locale)
+            obj_copy = self.copy_for_translation_with_unique_fields(locale)
+            try:
+                with transaction.atomic():
+                    obj_copy.save()
+            except IntegrityError as error:
+                # translation might have been created by concurrent request
+                try:
+                    return super().get_translation(locale)
+                except self.DoesNotExist:
+                    raise error
+            return obj_copy
 
     class Meta:
         abstract = True
@@ -37,7 +63,14 @@ class CustomTranslatableMixin(TranslatableMixin):
 class CustomFormSubmission(models.Model):
     """Data for a form submission."""
 
-    form_data = models.TextField("Form data")
+    form_data = models.JSONField(
+        "Form data",
+        null=True,
+        encoder=FormSubmissionSerializer,
+    )
+    # form data of submissions created before 'form_data' became JSONField,
+    # moved to 'form_data' by 'convert_submissions_form_data' command
+    form_data_text = models.TextField("Form data (text)", blank=True)
     form = models.ForeignKey(
         get_translatableform_model_string(),
         verbose_name="TranslatableForm",
@@ -45,18 +78,31 @@ class CustomFormSubmission(models.Model):
     )
     submit_time = models.DateTimeField("Submit time", auto_now_add=True)
 
+    def get_form_data(self):
+        """Returns dict with form data without submit time."""
+        if self.form_data is None:
+            # empty if row was created without form data
+            return loads(self.form_data_text or "{}")
+        return dict(self.form_data)
+
     def get_data(self):
         """Returns dict with form data."""
-        form_data = loads(self.form_data)
+        form_data = self.get_form_data()
         form_data.update({"submit_time": self.submit_time})
         return form_data
 
     def __str__(self):
-        return self.form_data
+        return dumps(self.get_form_data(), cls=FormSubmissionSerializer)
 
     class Meta:
-        ordering = ["-submit_time"]
+        ordering = ["-submit_time", "-id"]
         verbose_name = "Form submission"
+        indexes = [
+            models.Index(
+                fields=["form", "-submit_time", "-id"],
+                name="customformsubmission_time_idx",
+            ),
+        ]
 
 
 class CustomFormSubmissionFile(models.Model):
@@ -83,15 +129,101 @@ class CustomFormSubmissionFile(models.Model):
         return self.file.url
 
 
-def delete_file_from_storage(instance, **kwargs):
-    """Cleanup deleted files from disk"""
-    transaction.on_commit(lambda: instance.file.delete(False))
+def delete_file_from_storage(instance, using=None, **kwargs):
+    """Cleanup deleted files from disk after commit, in batch per transaction"""
+    if instance.file:
+        schedule_file_deletion(
+            instance.file.storage,
+            instance.file.name,
+            using or DEFAULT_DB_ALIAS,
+        )
 
 
 post_delete.connect(delete_file_from_storage, sender=CustomFormSubmissionFile)
 
 
+class FormSubmissionQueueItem(models.Model):
+    """Validated form submission waiting to be processed."""
+
+    STATUS_PENDING = "pending"
+    STATUS_PROCESSING = "processing"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PROCESSING, "Processing"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    form = models.ForeignKey(
+        get_translatableform_model_string(),
+        verbose_name="TranslatableForm",
+        on_delete=models.CASCADE,
+    )
+    payload = models.JSONField("Payload")
+    status = models.CharField(
+        "Status",
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    attempts = models.PositiveIntegerField("Attempts", default=0)
+    last_error = models.TextField("Last error", blank=True)
+    created_at = models.DateTimeField("Created at", auto_now_add=True)
+    available_at = models.DateTimeField("Available at", default=timezone.now)
+
+    def __str__(self):
+        return f"{self.form_id}: {self.status}"
+
+    class Meta:
+        ordering = ["pk"]
+        verbose_name = "Form submission queue item"
+        indexes = [models.Index(fields=["status", "available_at"])]
+
+
+class FormSubmissionStats(models.Model):
+    """
+    Denormalized submissions count and latest submit time of the form,
+    kept when WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_STATS is enabled.
+    """
+
+    form = models.OneToOneField(
+        get_translatableform_model_string(),
+        verbose_name="TranslatableForm",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="submission_stats",
+    )
+    count = models.PositiveIntegerField("Submissions count", default=0)
+    latest_submit_time = models.DateTimeField("Latest submit time", null=True)
+
+    def __str__(self):
+        return f"{self.form_id}: {self.count}"
+
+    class Meta:
+        verbose_name = "Form submission stats"
+
+
+def invalidate_serialized_form(instance, **kwargs):
+    """Drops cached serialized form of deleted form"""
+    form_cache.invalidate(instance.pk)
+
+
 class AbstractTranslatableForm(CustomTranslatableMixin, AbstractForm):
+    fields_data = models.JSONField(
+        "Fields data",
+        default=list,
+        blank=True,
+        editable=False,
+    )
+    # hash of translatable fields values the translation source was
+    # last synced with, stored by 'sync_translation_source' after sync
+    translation_fingerprint = models.CharField(
+        "Translation fingerprint",
+        max_length=40,
+        blank=True,
+        editable=False,
+    )
+    updated_at = models.DateTimeField("Updated at", auto_now=True)
 
     class Meta:
         abstract = True
@@ -135,30 +267,30 @@ class AbstractTranslatableForm(CustomTranslatableMixin, AbstractForm):
 
     @transaction.atomic()
     def delete(self, **kwargs) -> tuple[int, dict[str, int]]:
-        content = get_translation_source_content()
-        filtered = list(
-            filter(
-                lambda x: (tmp := loads(x))["pk"] == self.pk
-                and tmp["translation_key"] == str(self.translation_key),
-                content,
-            ),
-        )
-        if filtered:
-            related_forms = self.__class__.objects.exclude(pk=self.pk).filter(
+        if is_translation_source(self):
+            self.__class__.objects.exclude(pk=self.pk).filter(
                 translation_key=self.translation_key,
-            )
-            with transaction.atomic():
-                for ele in related_forms:
-                    ele.delete()
+            ).delete()
         return super().delete(**kwargs)
 
 
     def process_form_submission(self, form, ip_addr=None):
+        """
+        Runs each hook if selected in the form, or puts
+        the submission to the queue if queueing is enabled.
+        """
+
+        from .submission_queue import enqueue_form_submission, is_queue_enabled
+
+        if is_queue_enabled():
+            enqueue_form_submission(self, form, ip_addr)
+            return
+        self.run_form_submission_hooks(form, ip_addr)
+
+    def run_form_submission_hooks(self, form, ip_addr=None):
         """Runs each hook if selected in the form."""
 
-        for fn in hooks.get_hooks("process_form_submission"):
-            if fn.__name__ in self.process_form_submission_hooks:
-                fn(self, form, ip_addr)
+        run_submission_hooks(self, form, ip_addr)
 
     def get_data_fields(self):
         data_fields = super().get_data_fields()
@@ -167,10 +299,40 @@ class AbstractTranslatableForm(CustomTranslatableMixin, AbstractForm):
         return data_fields
 
     def save(self, *args, **kwargs) -> None:
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+        if update_fields is None or "fields" in update_fields:
+            self.fields_data = get_fields_data(self.fields.raw_data)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "fields_data"}
+        # translation source is synced only if translatable content is changed
+        sync_source = update_fields is None or not get_translatable_fields_names(
+            type(self),
+        ).isdisjoint(update_fields)
+        if sync_source:
+            fingerprint = get_translatable_content_fingerprint(self)
+            sync_source = fingerprint != self.translation_fingerprint
+        if (
+            update_fields is None
+            and not args
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+        ):
+            # fingerprint is written only by 'sync_translation_source'
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "translation_fingerprint"
+            ]
         super().save(*args, **kwargs)
-        source = TranslationSource.objects.get_for_instance_or_none(self)
-        if source:
-            TranslationSource.update_or_create_from_instance(self)
+        if sync_source:
+            schedule_translation_source_sync(
+                self, using=kwargs.get("using") or self._state.db,
+            )
+            # pending sync covers this content, repeated saves do not sync
+            self.translation_fingerprint = fingerprint
+        form_cache.invalidate(self.pk)
 
 
 class TranslatableForm(AbstractTranslatableForm):
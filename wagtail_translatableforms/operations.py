@@ -0,0 +1,174 @@
+from json import dumps
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from modelcluster.models import get_serializable_data_for_fields
+from wagtail_localize.models import (
+    TranslatableObject,
+    Translation,
+    TranslationSource,
+    get_schema_version,
+)
+
+from . import get_translatableform_model
+from .models import CustomFormSubmission, CustomFormSubmissionFile
+from .submission_stats import delete_submissions
+from .utils import batched
+
+
+def create_translations(forms, locales, batch_size=100):
+    """
+    Creates missing translations of the forms into the locales.
+    Forms are processed in batches, each batch costs a fixed number
+    of queries: missing (translation_key, locale) pairs are found
+    in one query and translations are created with one 'bulk_create'
+    along with wagtail-localize records.
+    Returns number of created translations.
+    """
+    if hasattr(forms, "iterator"):
+        forms = forms.iterator(chunk_size=batch_size)
+    locales = list(locales)
+    created = 0
+    for batch in batched(forms, batch_size):
+        with transaction.atomic():
+            created += len(_create_translations_batch(batch, locales))
+    return created
+
+
+def _create_translations_batch(forms, locales):
+    model = get_translatableform_model()
+    source_locales = {}
+    for key, locale_id in TranslationSource.objects.filter(
+        object_id__in={form.translation_key for form in forms},
+    ).values_list("object_id", "locale_id"):
+        source_locales.setdefault(key, set()).add(locale_id)
+    # forms which are translations of other forms are skipped
+    sources = {}
+    for form in forms:
+        if form.locale_id in source_locales.get(form.translation_key, {form.locale_id}):
+            sources.setdefault(form.translation_key, form)
+    existing = set(
+        model.objects.filter(
+            translation_key__in=sources.keys(),
+            locale__in=locales,
+        ).values_list("translation_key", "locale_id"),
+    )
+    translations = model.objects.bulk_create(
+        [
+            form.copy_for_translation_with_unique_fields(locale)
+            for form in sources.values()
+            for locale in locales
+            if locale.pk != form.locale_id
+            and (form.translation_key, locale.pk) not in existing
+        ],
+    )
+    if translations:
+        _create_translation_records(sources, translations, source_locales)
+    return translations
+
+
+def _create_translation_records(sources, translations, source_locales):
+    """
+    Creates wagtail-localize TranslatableObject, TranslationSource
+    and Translation records in bulk for created translations
+    and the source forms they were copied from.
+    """
+    forms = list(
+        {
+            translation.translation_key: sources[translation.translation_key]
+            for translation in translations
+        }.values(),
+    )
+    content_type = ContentType.objects.get_for_model(forms[0].get_translation_model())
+    translation_keys = {form.translation_key for form in forms}
+    TranslatableObject.objects.bulk_create(
+        [
+            TranslatableObject(translation_key=key, content_type=content_type)
+            for key in translation_keys
+        ],
+        ignore_conflicts=True,
+    )
+
+    schema_version = get_schema_version(forms[0]._meta.app_label)
+    now = timezone.now()
+    new_sources = [
+        TranslationSource(
+            object_id=form.translation_key,
+            specific_content_type=ContentType.objects.get_for_model(form.__class__),
+            locale_id=form.locale_id,
+            object_repr=str(form)[:200],
+            content_json=dumps(
+                get_serializable_data_for_fields(form),
+                cls=DjangoJSONEncoder,
+            ),
+            schema_version=schema_version,
+            last_updated_at=now,
+        )
+        for form in forms
+        if form.locale_id not in source_locales.get(form.translation_key, ())
+    ]
+    TranslationSource.objects.bulk_create(new_sources)
+
+    translation_sources = {
+        (source.object_id, source.locale_id): source
+        for source in TranslationSource.objects.filter(object_id__in=translation_keys)
+    }
+    for source in new_sources:
+        # segments are extracted per source, only once for new ones
+        translation_sources[(source.object_id, source.locale_id)].refresh_segments()
+
+    translation_mode = getattr(
+        settings, "WAGTAIL_LOCALIZE_DEFAULT_TRANSLATION_MODE", "synced"
+    )
+    Translation.objects.bulk_create(
+        [
+            Translation(
+                source=translation_sources[
+                    (
+                        translation.translation_key,
+                        sources[translation.translation_key].locale_id,
+                    )
+                ],
+                target_locale_id=translation.locale_id,
+                enabled=translation_mode == "synced",
+            )
+            for translation in translations
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def prune_submissions(form, cutoff, batch_size=1000, dry_run=False):
+    """
+    Deletes submissions of the form submitted before cutoff in primary key
+    ordered chunks, each chunk in own transaction. Files of the chunk are
+    removed from storage in one batch after the chunk is committed.
+    Yields numbers of deleted submissions and files per chunk.
+    """
+    queryset = CustomFormSubmission.objects.filter(form=form, submit_time__lt=cutoff)
+    if dry_run:
+        yield queryset.count(), CustomFormSubmissionFile.objects.filter(
+            submission__in=queryset,
+        ).count()
+        return
+    last_pk = None
+    while True:
+        with transaction.atomic():
+            chunk = queryset.order_by("pk")
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return
+            # post_delete of each file adds it to the deletion batch
+            # of the transaction, removed from storage after commit
+            files = CustomFormSubmissionFile.objects.filter(submission_id__in=pks)
+            deleted_files = files.delete()[1].get(
+                CustomFormSubmissionFile._meta.label, 0,
+            )
+            delete_submissions(CustomFormSubmission.objects.filter(pk__in=pks))
+        last_pk = pks[-1]
+        yield len(pks), deleted_files
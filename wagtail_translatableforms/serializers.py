@@ -1,9 +1,14 @@
+from django.db.models import Q
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from wagtailstreamforms.utils.general import get_slug_from_string
+from wagtail.blocks import ListBlock, StreamBlock, StructBlock
 
 from . import get_translatableform_model
+from .cache import form_cache
 from .models import CustomFormSubmission
+from .utils import get_fields_data
+
+PREFETCHED_FORMS_CONTEXT_KEY = "prefetched_translatableforms"
 
 
 class FrieldsDataSerializer(serializers.Serializer):
@@ -13,6 +18,7 @@ class FrieldsDataSerializer(serializers.Serializer):
     required = serializers.BooleanField()
     help_text = serializers.CharField()
     default_value = serializers.CharField()
+    choices = serializers.ListField(child=serializers.CharField(), required=False)
 
 
 class TranslatableFormSerializer(serializers.ModelSerializer):
@@ -35,12 +41,9 @@ class TranslatableFormSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(field=FrieldsDataSerializer(many=True))
     def get_fields_data(self, obj):
-        fields_data = [
-            {"type": ele["type"], **ele["value"]} for ele in list(obj.fields.raw_data)
-        ]
-        return [
-            {"slug": get_slug_from_string(ele["label"]), **ele} for ele in fields_data
-        ]
+        if obj.fields_data or not obj.fields:
+            return obj.fields_data
+        return get_fields_data(obj.fields.raw_data)
 
 
 class TranslatableFormSubmissionSerializer(serializers.ModelSerializer):
@@ -49,8 +52,176 @@ class TranslatableFormSubmissionSerializer(serializers.ModelSerializer):
         fields = ("form_id",)
 
 
-def serialize_form(form_pk, serializer=TranslatableFormSerializer):
+class FormsBulkQuerySerializer(serializers.Serializer):
+    id = serializers.ListField(child=serializers.IntegerField(), required=False)
+    slug = serializers.ListField(child=serializers.CharField(), required=False)
+    translation_key = serializers.ListField(
+        child=serializers.UUIDField(), required=False,
+    )
+    locale = serializers.ListField(child=serializers.CharField(), required=False)
+
+    def validate(self, attrs):
+        if not any(attrs.get(name) for name in ("id", "slug", "translation_key")):
+            raise serializers.ValidationError(
+                "Pass at least one of 'id', 'slug' or 'translation_key'.",
+            )
+        return attrs
+
+
+def get_forms_in_bulk(form_pks):
+    """Fetches forms by pks in one query, returns dict {pk: form}."""
+    return get_translatableform_model().objects.select_related(
+        "post_redirect_page",
+        "site",
+    ).in_bulk(set(form_pks))
+
+
+def collect_form_pks(block, value):
+    """Collects pks of forms referenced in raw block value."""
+
+    from .blocks import TranslatableFormBlock
+
+    form_pks = set()
+    if not value:
+        return form_pks
+    if isinstance(block, TranslatableFormBlock):
+        if form_pk := value.get("form"):
+            form_pks.add(form_pk)
+    elif isinstance(block, StreamBlock):
+        for child in value:
+            if child_block := block.child_blocks.get(child["type"]):
+                form_pks |= collect_form_pks(child_block, child["value"])
+    elif isinstance(block, StructBlock):
+        for name, child_block in block.child_blocks.items():
+            form_pks |= collect_form_pks(child_block, value.get(name))
+    elif isinstance(block, ListBlock):
+        for item in value:
+            if isinstance(item, dict) and item.get("type") == "item":
+                item = item["value"]
+            form_pks |= collect_form_pks(block.child_block, item)
+    return form_pks
+
+
+def prefetch_forms(stream_value, context=None):
+    """
+    Fetches forms referenced in StreamField value in one query
+    and stores them in context used by 'serialize_form'.
+    """
+    context = {} if context is None else context
+    forms = context.setdefault(PREFETCHED_FORMS_CONTEXT_KEY, {})
+    form_pks = collect_form_pks(stream_value.stream_block, stream_value.raw_data)
+    if form_pks := form_pks - forms.keys():
+        forms.update(get_forms_in_bulk(form_pks))
+    return context
+
+
+def get_form(form_pk, context=None):
+    """Returns form prefetched to context, fetches it otherwise."""
+    forms = (context or {}).get(PREFETCHED_FORMS_CONTEXT_KEY, {})
+    if form_pk in forms:
+        return forms[form_pk]
+    return get_translatableform_model().objects.select_related(
+        "post_redirect_page",
+        "site",
+    ).get(pk=form_pk)
+
+
+def get_form_queryset(pk=None, slug=None, language_code=None):
+    """
+    Returns queryset of the form by id or slug, or of its
+    translation into the locale if language code is passed.
+    """
+    model = get_translatableform_model()
+    if pk is not None:
+        queryset = model.objects.filter(pk=pk)
+    else:
+        queryset = model.objects.filter(slug=slug)
+    if language_code:
+        queryset = model.objects.filter(
+            translation_key__in=queryset.values("translation_key"),
+            locale__language_code=language_code,
+        )
+    return queryset
+
+
+def get_forms_translations(ids=(), slugs=(), translation_keys=(), locales=None):
+    """
+    Fetches forms referenced by ids, slugs or translation keys in locales
+    (language codes, all locales if not passed) with one query. Returns
+    dict {(translation_key, language_code): form}, missing pairs are skipped.
+    """
+    model = get_translatableform_model()
+    source_forms = model.objects.filter(
+        Q(pk__in=ids) | Q(slug__in=slugs) | Q(translation_key__in=translation_keys),
+    )
+    queryset = model.objects.filter(
+        translation_key__in=source_forms.values("translation_key"),
+    ).select_related("locale", "post_redirect_page", "site")
+    if locales is not None:
+        queryset = queryset.filter(locale__language_code__in=locales)
+    return {(form.translation_key, form.locale.language_code): form for form in queryset}
+
+
+def serialize_forms(
+    ids=(),
+    slugs=(),
+    translation_keys=(),
+    locales=None,
+    serializer=TranslatableFormSerializer,
+):
+    """
+    Bulk 'serialize_form', returns serialized forms found
+    by 'get_forms_translations' with the same keys.
+    """
+    return {
+        key: form_cache.get_or_set(
+            form.pk, serializer, lambda form=form: serializer(form).data,
+        )
+        for key, form in get_forms_translations(
+            ids, slugs, translation_keys, locales,
+        ).items()
+    }
+
+
+async def aget_form(form_pk, context=None):
+    """Async 'get_form'."""
+    forms = (context or {}).get(PREFETCHED_FORMS_CONTEXT_KEY, {})
+    if form_pk in forms:
+        return forms[form_pk]
+    return await get_translatableform_model().objects.select_related(
+        "post_redirect_page",
+        "site",
+    ).aget(pk=form_pk)
+
+
+def serialize_form(
+    form_pk, serializer=TranslatableFormSerializer, context=None, version=None,
+):
+    if form_pk:
+        return form_cache.get_or_set(
+            form_pk,
+            serializer,
+            lambda: serializer(get_form(form_pk, context)).data,
+            version,
+        )
+
+
+def serialize_form_instance(form, serializer=TranslatableFormSerializer):
+    """'serialize_form' of already fetched form, form is not fetched again."""
+    return form_cache.get_or_set(form.pk, serializer, lambda: serializer(form).data)
+
+
+async def aserialize_form(
+    form_pk, serializer=TranslatableFormSerializer, context=None, version=None,
+):
+    """
+    Async 'serialize_form'. Form is fetched with async ORM,
+    serializer must not query database, as default one does not.
+    """
     if form_pk:
-        form_instance = get_translatableform_model().objects.get(pk=form_pk)
-        form_serializer = serializer(form_instance)
-        return form_serializer.data
\ No newline at end of file
+
+        async def serialize():
+            return serializer(await aget_form(form_pk, context)).data
+
+        return await form_cache.aget_or_set(form_pk, serializer, serialize, version)
+
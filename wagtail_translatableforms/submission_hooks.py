@@ -0,0 +1,256 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections, connection
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+from wagtailstreamforms import hooks
+
+from . import executors
+
+logger = logging.getLogger(__name__)
+
+HOOK_NAME = "process_form_submission"
+WORKERS_SETTING = "WAGTAIL_TRANSLATABLEFORM_HOOK_WORKERS"
+DISPATCH_CACHE_SIZE = 1024
+
+_dispatch = OrderedDict()
+_dispatch_lock = threading.Lock()
+
+
+class SubmissionHooksError(Exception):
+    """
+    Raised when concurrent hooks failed, after all of them finished.
+    'errors' maps names of the failed hooks to their exceptions.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            ", ".join(f"{name}: {error!r}" for name, error in errors.items()),
+        )
+
+
+def independent_hook(fn):
+    """
+    Marks hook which does not depend on other hooks, e.g. sends email,
+    so it can run concurrently with other independent hooks.
+    Coroutine function hooks are always run concurrently.
+    Pool threads use own database connections, so the hook has no
+    transactional guarantees: it does not see uncommitted rows of the
+    caller and its writes are kept if the caller rolls back. Inside
+    atomic block independent hooks run one by one on the calling thread.
+    """
+    fn.independent = True
+    return fn
+
+
+def async_counterpart(async_fn):
+    """
+    Sets coroutine function awaited instead of the hook
+    by 'arun_submission_hooks', e.g. one using async ORM.
+    """
+
+    def decorator(fn):
+        fn.async_hook = async_fn
+        return fn
+
+    return decorator
+
+
+def is_concurrent_hook(fn):
+    return asyncio.iscoroutinefunction(fn) or getattr(fn, "independent", False)
+
+
+def get_workers():
+    """Number of threads running independent hooks, 0 runs them one by one."""
+    return executors.get_workers(WORKERS_SETTING, 4)
+
+
+def get_executor():
+    return executors.get_executor("hooks", WORKERS_SETTING, 4)
+
+
+def get_registry_generation():
+    """
+    Returns number of enabled 'process_form_submission' hooks, hooks
+    are only appended to the registry so it changes with the registry.
+    """
+    return len(hooks.get_hooks(HOOK_NAME))
+
+
+def get_submission_hooks(instance):
+    """
+    Returns hooks selected in the form in registry order. Names are matched
+    exactly, result is cached per form version and registry generation.
+    """
+    generation = get_registry_generation()
+    key = (instance.pk, instance.updated_at)
+    with _dispatch_lock:
+        entry = _dispatch.get(key)
+        if entry is not None and entry[0] == generation:
+            _dispatch.move_to_end(key)
+            return entry[1]
+    selected = instance._meta.get_field("process_form_submission_hooks").to_python(
+        instance.process_form_submission_hooks,
+    )
+    fns = tuple(fn for fn in hooks.get_hooks(HOOK_NAME) if fn.__name__ in selected)
+    if instance.pk is not None:
+        with _dispatch_lock:
+            _dispatch[key] = (generation, fns)
+            _dispatch.move_to_end(key)
+            while len(_dispatch) > DISPATCH_CACHE_SIZE:
+                _dispatch.popitem(last=False)
+    return fns
+
+
+@lru_cache(maxsize=None)
+def get_hook_timing_callback():
+    """Returns timing callback from settings, it is imported once."""
+    path = getattr(settings, "WAGTAIL_TRANSLATABLEFORM_HOOK_TIMING_CALLBACK", None)
+    return import_string(path) if path else None
+
+
+@receiver(setting_changed)
+def clear_hook_timing_callback(setting, **kwargs):
+    if setting == "WAGTAIL_TRANSLATABLEFORM_HOOK_TIMING_CALLBACK":
+        get_hook_timing_callback.cache_clear()
+
+
+def run_submission_hooks(instance, form, request=None):
+    """
+    Runs hooks selected in the form. Hooks run one by one in registry
+    order, then independent hooks run concurrently on the thread pool
+    (outside of atomic block only) and coroutine hooks with 'asyncio.gather'. Duration of each hook is
+    passed to timing callback as callback(instance, hook_name, seconds).
+    """
+    callback = get_hook_timing_callback()
+    concurrent_hooks = []
+    for fn in get_submission_hooks(instance):
+        if is_concurrent_hook(fn):
+            concurrent_hooks.append(fn)
+        else:
+            _run_hook(fn, callback, instance, form, request)
+    if concurrent_hooks:
+        errors = run_concurrent_hooks(
+            concurrent_hooks, callback, instance, form, request,
+        )
+        if errors:
+            raise SubmissionHooksError(errors)
+
+
+def run_concurrent_hooks(fns, callback, instance, form, request=None):
+    """Runs hooks concurrently, returns exceptions of failed hooks by name."""
+    errors = {}
+    futures = {}
+    coroutine_fns = []
+    for fn in fns:
+        if asyncio.iscoroutinefunction(fn):
+            coroutine_fns.append(fn)
+        elif get_workers() and not connection.in_atomic_block:
+            futures[fn.__name__] = get_executor().submit(
+                _run_hook_in_thread, fn, callback, instance, form, request,
+            )
+        else:
+            try:
+                _run_hook(fn, callback, instance, form, request)
+            except Exception as error:
+                errors[fn.__name__] = error
+    if coroutine_fns:
+        results = async_to_sync(_gather_hooks)(
+            coroutine_fns, callback, instance, form, request,
+        )
+        errors.update(_get_errors(coroutine_fns, results))
+    for name, future in futures.items():
+        if future.exception() is not None:
+            errors[name] = future.exception()
+    _log_errors(errors)
+    return errors
+
+
+async def arun_submission_hooks(instance, form, request=None):
+    """
+    Async 'run_submission_hooks'. Async counterparts of hooks and coroutine
+    function hooks are awaited, other hooks run in threads with 'sync_to_async'.
+    """
+    callback = get_hook_timing_callback()
+    concurrent_hooks = []
+    for fn in get_submission_hooks(instance):
+        if is_concurrent_hook(fn):
+            concurrent_hooks.append(fn)
+        else:
+            await _arun_hook(fn, callback, instance, form, request)
+    if concurrent_hooks:
+        results = await _gather_hooks(
+            concurrent_hooks, callback, instance, form, request,
+        )
+        errors = _get_errors(concurrent_hooks, results)
+        _log_errors(errors)
+        if errors:
+            raise SubmissionHooksError(errors)
+
+
+def _get_errors(fns, results):
+    return {
+        fn.__name__: result
+        for fn, result in zip(fns, results)
+        if isinstance(result, Exception)
+    }
+
+
+def _log_errors(errors):
+    for name, error in errors.items():
+        logger.error("Submission hook %s failed", name, exc_info=error)
+
+
+def _run_hook(fn, callback, instance, form, request):
+    if callback is None:
+        fn(instance, form, request)
+        return
+    started = time.perf_counter()
+    try:
+        fn(instance, form, request)
+    finally:
+        callback(instance, fn.__name__, time.perf_counter() - started)
+
+
+def _run_hook_in_thread(fn, callback, instance, form, request):
+    try:
+        _run_hook(fn, callback, instance, form, request)
+    finally:
+        close_old_connections()
+
+
+async def _arun_hook(fn, callback, instance, form, request):
+    async_fn = getattr(fn, "async_hook", None)
+    if async_fn is None:
+        if asyncio.iscoroutinefunction(fn):
+            async_fn = fn
+        elif getattr(fn, "independent", False) and get_workers():
+            async_fn = sync_to_async(
+                partial(_run_hook_in_thread, fn, None),
+                thread_sensitive=False,
+                executor=get_executor(),
+            )
+        else:
+            async_fn = sync_to_async(fn)
+    started = time.perf_counter()
+    try:
+        await async_fn(instance, form, request)
+    finally:
+        if callback is not None:
+            callback(instance, fn.__name__, time.perf_counter() - started)
+
+
+async def _gather_hooks(fns, callback, instance, form, request):
+    return await asyncio.gather(
+        *(_arun_hook(fn, callback, instance, form, request) for fn in fns),
+        return_exceptions=True,
+    )
@@ -0,0 +1,181 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from json import dumps, loads
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.datastructures import CaseInsensitiveMapping, MultiValueDict
+from wagtailstreamforms.serializers import FormSubmissionSerializer
+
+from .file_uploads import delete_stored_files, store_files
+from .models import CustomFormSubmissionFile, FormSubmissionQueueItem
+
+logger = logging.getLogger(__name__)
+
+QUEUED_HEADERS = ("X-Real-Ip",)
+
+
+def is_queue_enabled():
+    return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_QUEUE_SUBMISSIONS", False)
+
+
+class QueuedForm:
+    """
+    Validated form passed to submission hooks by the queue worker.
+    Values of 'cleaned_data' are JSON decoded, 'files' holds names
+    of the files already written to storage.
+    """
+
+    def __init__(self, cleaned_data, files):
+        self.cleaned_data = cleaned_data
+        self.files = MultiValueDict(files)
+
+    def is_valid(self):
+        return True
+
+
+class QueuedRequest:
+    """Request passed to submission hooks by the queue worker."""
+
+    def __init__(self, headers):
+        self.headers = CaseInsensitiveMapping(headers)
+
+
+def enqueue_form_submission(instance, form, request=None):
+    """
+    Puts validated form submission to the queue. Uploaded files
+    are written to storage since they do not outlive the request.
+    """
+    submission_files = [
+        CustomFormSubmissionFile(field=field, file=file)
+        for field in form.files
+        for file in form.files.getlist(field)
+    ]
+    stored_files = store_files(
+        submission_file.file for submission_file in submission_files
+    )
+    try:
+        files = {}
+        for submission_file in submission_files:
+            files.setdefault(submission_file.field, []).append(
+                submission_file.file.name,
+            )
+        cleaned_data = {
+            key: value
+            for key, value in form.cleaned_data.items()
+            if key not in form.files
+        }
+        headers = getattr(request, "headers", {})
+        return FormSubmissionQueueItem.objects.create(
+            form=instance,
+            payload={
+                "data": loads(dumps(cleaned_data, cls=FormSubmissionSerializer)),
+                "files": files,
+                "headers": {
+                    header: headers[header]
+                    for header in QUEUED_HEADERS
+                    if header in headers
+                },
+            },
+        )
+    except Exception:
+        delete_stored_files(stored_files)
+        raise
+
+
+def claim_queue_items(batch_size, lock_timeout):
+    """
+    Marks batch of due queue items as processing. Items which stay
+    processing longer than 'lock_timeout' are claimed again.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = FormSubmissionQueueItem.objects.filter(
+            status__in=(
+                FormSubmissionQueueItem.STATUS_PENDING,
+                FormSubmissionQueueItem.STATUS_PROCESSING,
+            ),
+            available_at__lte=now,
+        ).select_related("form").order_by("pk")
+        if connection.features.has_select_for_update_skip_locked:
+            # only queue rows are locked, not the joined forms
+            of = ("self",) if connection.features.has_select_for_update_of else ()
+            queryset = queryset.select_for_update(skip_locked=True, of=of)
+        items = list(queryset[:batch_size])
+        FormSubmissionQueueItem.objects.filter(
+            pk__in=[item.pk for item in items],
+        ).update(
+            status=FormSubmissionQueueItem.STATUS_PROCESSING,
+            attempts=F("attempts") + 1,
+            available_at=now + lock_timeout,
+        )
+    for item in items:
+        item.attempts += 1
+    return items
+
+
+def process_queue_item(item, max_attempts, retry_delay):
+    """
+    Runs submission hooks of the queued item, the item is deleted in the
+    same transaction. Failed item is retried later or marked as failed
+    after 'max_attempts'. Returns item status or None if it was processed.
+    """
+    try:
+        with transaction.atomic():
+            queued_form = QueuedForm(item.payload["data"], item.payload["files"])
+            queued_request = QueuedRequest(item.payload["headers"])
+            item.form.run_form_submission_hooks(queued_form, queued_request)
+            FormSubmissionQueueItem.objects.filter(pk=item.pk).delete()
+    except Exception as error:
+        logger.exception("Queued form submission %s failed", item.pk)
+        if item.attempts >= max_attempts:
+            status = FormSubmissionQueueItem.STATUS_FAILED
+        else:
+            status = FormSubmissionQueueItem.STATUS_PENDING
+        FormSubmissionQueueItem.objects.filter(pk=item.pk).update(
+            status=status,
+            last_error=repr(error),
+            available_at=timezone.now() + retry_delay * item.attempts,
+        )
+        return status
+    return None
+
+
+def process_submission_queue(
+    batch_size=100,
+    concurrency=1,
+    max_attempts=5,
+    retry_delay=timedelta(minutes=1),
+    lock_timeout=timedelta(minutes=10),
+):
+    """
+    Processes queued submissions in batches until the queue has no due items.
+    Returns counters of processed, retried and failed items.
+    """
+    stats = {"processed": 0, "retried": 0, "failed": 0}
+
+    def process(item):
+        try:
+            return process_queue_item(item, max_attempts, retry_delay)
+        finally:
+            # connection of the pool thread is not reused after the pool exits
+            if concurrency > 1:
+                connection.close()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while items := claim_queue_items(batch_size, lock_timeout):
+            if concurrency > 1:
+                results = list(executor.map(process, items))
+            else:
+                results = [process(item) for item in items]
+            for status in results:
+                if status is None:
+                    stats["processed"] += 1
+                elif status == FormSubmissionQueueItem.STATUS_PENDING:
+                    stats["retried"] += 1
+                else:
+                    stats["failed"] += 1
+    return stats
@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import CustomFormSubmission, FormSubmissionStats
+
+
+def is_stats_enabled():
+    return getattr(settings, "WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_STATS", False)
+
+
+def annotate_submission_stats(queryset):
+    """
+    Annotates forms queryset with 'submissions_count' and 'latest_submit_time',
+    read from stats table if it is enabled or with one grouped query otherwise.
+    """
+    if is_stats_enabled():
+        return queryset.annotate(
+            submissions_count=Coalesce(F("submission_stats__count"), 0),
+            latest_submit_time=F("submission_stats__latest_submit_time"),
+        )
+    return queryset.annotate(
+        submissions_count=Count("customformsubmission"),
+        latest_submit_time=Max("customformsubmission__submit_time"),
+    )
+
+
+def _get_increment(submission):
+    return {
+        "count": F("count") + 1,
+        "latest_submit_time": Coalesce(
+            Greatest("latest_submit_time", Value(submission.submit_time)),
+            Value(submission.submit_time),
+        ),
+    }
+
+
+def record_submission(submission):
+    """Increments stats of the submission form."""
+    if not is_stats_enabled():
+        return
+    stats = FormSubmissionStats.objects.filter(form_id=submission.form_id)
+    if stats.update(**_get_increment(submission)):
+        return
+    try:
+        with transaction.atomic():
+            FormSubmissionStats.objects.create(
+                form_id=submission.form_id,
+                count=1,
+                latest_submit_time=submission.submit_time,
+            )
+    except IntegrityError:
+        # created by concurrent submission
+        stats.update(**_get_increment(submission))
+
+
+async def arecord_submission(submission):
+    """Async 'record_submission'."""
+    if not is_stats_enabled():
+        return
+    stats = FormSubmissionStats.objects.filter(form_id=submission.form_id)
+    if await stats.aupdate(**_get_increment(submission)):
+        return
+    try:
+        await FormSubmissionStats.objects.acreate(
+            form_id=submission.form_id,
+            count=1,
+            latest_submit_time=submission.submit_time,
+        )
+    except IntegrityError:
+        # created by concurrent submission
+        await stats.aupdate(**_get_increment(submission))
+
+
+def delete_submissions(queryset):
+    """
+    Deletes submissions and decrements stats of their forms,
+    latest submit time is taken from remaining submissions.
+    Returns number of deleted submissions.
+    """
+    with transaction.atomic():
+        counts = {}
+        if is_stats_enabled():
+            counts = dict(
+                queryset.order_by()
+                .values("form")
+                .annotate(count=Count("pk"))
+                .values_list("form", "count")
+            )
+        deleted = queryset.delete()[1].get(CustomFormSubmission._meta.label, 0)
+        for form_id, count in counts.items():
+            FormSubmissionStats.objects.filter(form_id=form_id).update(
+                count=Greatest(F("count") - count, 0),
+                latest_submit_time=Subquery(
+                    CustomFormSubmission.objects.filter(form_id=OuterRef("form_id"))
+                    .order_by("-submit_time")
+                    .values("submit_time")[:1]
+                ),
+            )
+    return deleted
+
+
+def rebuild_submission_stats():
+    """Recounts stats of all forms with one grouped query."""
+    with transaction.atomic():
+        FormSubmissionStats.objects.all().delete()
+        FormSubmissionStats.objects.bulk_create(
+            FormSubmissionStats(
+                form_id=row["form"],
+                count=row["count"],
+                latest_submit_time=row["latest_submit_time"],
+            )
+            for row in CustomFormSubmission.objects.order_by()
+            .values("form")
+            .annotate(count=Count("pk"), latest_submit_time=Max("submit_time"))
+        )
@@ -0,0 +1,74 @@
+from asgiref.sync import sync_to_async
+from django.template.defaultfilters import pluralize
+
+from .file_uploads import delete_stored_files, store_files
+from .models import AbstractTranslatableForm, CustomFormSubmissionFile
+from .submission_hooks import arun_submission_hooks
+from .submission_queue import enqueue_form_submission, is_queue_enabled
+from .submission_stats import arecord_submission
+
+
+def get_submission_data(form, request):
+    """Returns form data of the submission, files are replaced with their count."""
+    # copy the cleaned_data so we dont mess with the original
+    submission_data = form.cleaned_data.copy()
+    submission_data["IP"] = request.headers.get("X-Real-Ip", "-")
+    # change the submission data to a count of the files
+    for field in form.files.keys():
+        count = len(form.files.getlist(field))
+        submission_data[field] = '{} file{}'.format(count, pluralize(count))
+    return submission_data
+
+
+def get_submission_files(form):
+    """Returns unsaved submission files of the form files."""
+    return [
+        CustomFormSubmissionFile(field=field, file=file)
+        for field in form.files
+        for file in form.files.getlist(field)
+    ]
+
+
+async def asave_customform_submission_data(instance, form, request):
+    """
+    Async counterpart of 'save_customform_submission_data' hook. Async ORM
+    has no transactions, so the submission is deleted if saving its files fails.
+    """
+    submission_data = get_submission_data(form, request)
+    submission_files = get_submission_files(form)
+    stored_files = await sync_to_async(store_files)(
+        [submission_file.file for submission_file in submission_files],
+    )
+    submission = None
+    try:
+        submission = await instance.get_submission_class().objects.acreate(
+            form_data=submission_data,
+            form=instance,
+        )
+        for submission_file in submission_files:
+            submission_file.submission = submission
+        await CustomFormSubmissionFile.objects.abulk_create(submission_files)
+        await arecord_submission(submission)
+    except Exception:
+        if submission is not None:
+            await submission.adelete()
+        await sync_to_async(delete_stored_files)(stored_files)
+        raise
+
+
+async def aprocess_form_submission(instance, form, request=None):
+    """
+    Async 'process_form_submission' of the form. If custom form model
+    overrides 'process_form_submission', the override is run in a thread,
+    so API and form view submissions behave the same.
+    """
+    if (
+        type(instance).process_form_submission
+        is not AbstractTranslatableForm.process_form_submission
+    ):
+        await sync_to_async(instance.process_form_submission)(form, request)
+        return
+    if is_queue_enabled():
+        await sync_to_async(enqueue_form_submission)(instance, form, request)
+        return
+    await arun_submission_hooks(instance, form, request)
@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 
 from django.contrib.admin.templatetags.admin_list import result_headers, ResultList
 from django.contrib.admin.utils import (
@@ -13,7 +14,9 @@ from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.core.exceptions import ObjectDoesNotExist
 from django.template import Library
-from wagtail.contrib.modeladmin.templatetags.modeladmin_tags import results
+from wagtail.contrib.modeladmin.templatetags.modeladmin_tags import (
+    result_row_display,
+)
 from wagtail.snippets.models import SnippetAdminURLFinder
 
 from .. import get_translatableform_model
@@ -21,19 +24,44 @@ from .. import get_translatableform_model
 register = Library()
 
 
-def items_for_result(view, result, request):
+@lru_cache
+def get_url_finder_class():
+    return type(
+        "_SnippetAdminURLFinder",
+        (SnippetAdminURLFinder,),
+        {"model": get_translatableform_model()}
+    )
+
+
+class ListColumn:
+    """
+    Column of the result list, its display settings and action buttons
+    column are resolved once per list instead of once per cell.
+    """
+
+    def __init__(self, field_name, modeladmin, add_buttons_field):
+        self.field_name = field_name
+        self.empty_value_display = modeladmin.get_empty_value_display(field_name)
+        self.is_primary = field_name == add_buttons_field
+
+
+def get_list_columns(view, request):
+    modeladmin = view.model_admin
+    add_buttons_field = modeladmin.get_list_display_add_buttons(request)
+    return [
+        ListColumn(field_name, modeladmin, add_buttons_field)
+        for field_name in view.list_display
+    ]
+
+
+def items_for_result(view, result, columns, url_finder):
     """
     Generates the actual list of data.
     """
     modeladmin = view.model_admin
-    url_finder_class = type(
-            "_SnippetAdminURLFinder",
-            (SnippetAdminURLFinder,),
-            {"model": get_translatableform_model()}
-        )
-    url_finder = url_finder_class(request.user)
-    for field_name in view.list_display:
-        empty_value_display = modeladmin.get_empty_value_display(field_name)
+    for column in columns:
+        field_name = column.field_name
+        empty_value_display = column.empty_value_display
         row_classes = ["field-%s" % field_name, "title"]
         try:
             f, attr, value = lookup_field(field_name, result, modeladmin)
@@ -79,7 +107,7 @@ def items_for_result(view, result, request):
         row_attrs["class"] = " ".join(row_classes)
         row_attrs_flat = flatatt(row_attrs)
         primary_button = None
-        if field_name == modeladmin.get_list_display_add_buttons(request):
+        if column.is_primary:
             primary_button = view.button_helper.get_primary_button(result)
         if primary_button is not None and primary_button.get("url"):
             yield format_html(
@@ -93,9 +121,10 @@ def items_for_result(view, result, request):
             yield format_html("<td{}>{}</td>", row_attrs_flat, result_repr)
 
 
-def results(view, object_list, request):
+def results(view, object_list, request, columns):
+    url_finder = get_url_finder_class()(request.user)
     for item in object_list:
-        yield ResultList(None, items_for_result(view, item, request))
+        yield ResultList(None, items_for_result(view, item, columns, url_finder))
 
 
 @register.inclusion_tag("customforms/result_list.html", takes_context=True)
@@ -110,11 +139,41 @@ def custom_result_list(context):
     for h in headers:
         if h["sortable"] and h["sorted"]:
             num_sorted_fields += 1
+    columns = get_list_columns(view, context["request"])
     context.update(
         {
             "result_headers": headers,
             "num_sorted_fields": num_sorted_fields,
-            "results": list(results(view, object_list, context["request"])),
+            "results": list(results(view, object_list, context["request"], columns)),
+            "primary_column_index": next(
+                (i for i, column in enumerate(columns) if column.is_primary), None
+            ),
+        }
+    )
+    return context
+
+
+@register.inclusion_tag("customforms/result_row.html", takes_context=True)
+def custom_result_row_display(context, index):
+    return result_row_display(context, index)
+
+
+@register.inclusion_tag("modeladmin/includes/result_row_value.html", takes_context=True)
+def custom_result_row_value_display(context, index):
+    """
+    Same as 'result_row_value_display' of modeladmin, but the column
+    with action buttons is taken from 'custom_result_list' context.
+    """
+    item = context["item"]
+    closing_tag = mark_safe(item[-5:])
+    add_action_buttons = index == context["primary_column_index"]
+    if add_action_buttons:
+        item = mark_safe(item[0:-5])
+    context.update(
+        {
+            "item": item,
+            "add_action_buttons": add_action_buttons,
+            "closing_tag": closing_tag,
         }
     )
-    return context
\ No newline at end of file
+    return context
@@ -0,0 +1,95 @@
+import threading
+import weakref
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from wagtail_localize.models import TranslationSource
+
+from .utils import get_translatable_content_fingerprint
+
+_local = threading.local()
+
+
+def sync_translation_source(model, pk, using=DEFAULT_DB_ALIAS):
+    """
+    Updates translation source of the saved instance if it is a source.
+    Instance is read again, so its committed state is extracted. Synced
+    content fingerprint is stored only after the source is updated, so
+    failed sync is repeated on the next save.
+    """
+    queryset = model._default_manager.using(using).filter(pk=pk)
+    instance = queryset.first()
+    if instance is None:
+        return
+    if TranslationSource.objects.get_for_instance_or_none(instance):
+        TranslationSource.update_or_create_from_instance(instance)
+    queryset.update(
+        translation_fingerprint=get_translatable_content_fingerprint(instance),
+    )
+
+
+class SourceSyncBatch:
+    """Instances saved in one transaction, synced once after commit."""
+
+    def __init__(self, using):
+        self.using = using
+        self.keys = set()
+        self.executed = False
+
+    def __call__(self):
+        self.executed = True
+        for model, pk in self.keys:
+            sync_translation_source(model, pk, self.using)
+
+
+def schedule_translation_source_sync(instance, using=DEFAULT_DB_ALIAS):
+    """
+    Syncs translation source of the instance after commit of the current
+    transaction, repeated saves of the instance are synced once. Outside
+    of transaction the source is synced immediately.
+    """
+    key = (type(instance), instance.pk)
+    deferred = getattr(_local, "deferred", None)
+    if deferred is not None:
+        deferred[key] = using
+        return
+    _schedule(key, using)
+
+
+def _schedule(key, using):
+    connection = connections[using]
+    if not connection.in_atomic_block:
+        sync_translation_source(*key, using)
+        return
+    batches = getattr(_local, "batches", None)
+    if batches is None:
+        batches = _local.batches = weakref.WeakValueDictionary()
+    savepoint_ids = tuple(connection.savepoint_ids)
+    # batch of outer savepoint is synced even if this savepoint is rolled back
+    for i in range(len(savepoint_ids) + 1):
+        batch = batches.get((using, savepoint_ids[:i]))
+        if batch is not None and not batch.executed and key in batch.keys:
+            return
+    batch = batches.get((using, savepoint_ids))
+    if batch is None or batch.executed:
+        batch = batches[(using, savepoint_ids)] = SourceSyncBatch(using)
+        transaction.on_commit(batch, using=using)
+    batch.keys.add(key)
+
+
+@contextmanager
+def defer_translation_source_sync():
+    """
+    Defers translation source syncs until the end of the block, e.g. in bulk
+    scripts. Each saved instance is synced once, nested blocks join the outer one.
+    """
+    if getattr(_local, "deferred", None) is not None:
+        yield
+        return
+    _local.deferred = {}
+    try:
+        yield
+    finally:
+        deferred, _local.deferred = _local.deferred, None
+        for key, using in deferred.items():
+            _schedule(key, using)
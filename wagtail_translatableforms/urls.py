@@ -1,6 +1,10 @@
 from django.urls import path
 
-from .views import CustomSubmissionListView, CustomSubmissionDeleteView
+from .views import (
+    CustomSubmissionDeleteView,
+    CustomSubmissionExportView,
+    CustomSubmissionListView,
+)
 
 urlpatterns = [
     path(
@@ -8,6 +12,11 @@ urlpatterns = [
         CustomSubmissionListView.as_view(),
         name="streamforms_submissions",
     ),
+    path(
+        "<int:pk>/submissions/export/",
+        CustomSubmissionExportView.as_view(),
+        name="streamforms_export_submissions",
+    ),
     path(
         "<int:pk>/submissions/delete/",
         CustomSubmissionDeleteView.as_view(),
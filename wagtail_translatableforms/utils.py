@@ -1,27 +1,171 @@
 import ast
 import contextlib
+import hashlib
 import inspect
+from itertools import islice
+from json import dumps, loads
 
 from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models.signals import class_prepared
+from wagtail.fields import StreamField
+from wagtail_localize.fields import TranslatableField, get_translatable_fields
+from wagtailstreamforms.utils.general import get_slug_from_string
 
 from . import get_translatableform_model
 
-def get_translation_source_content():
+_unique_fields_registry = {}
+_translatable_fields_registry = {}
+
+
+def batched(iterable, size):
+    """Splits iterable into lists of 'size' length."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def get_fields_data(raw_data):
+    """Returns form fields schema from raw data of form fields StreamField."""
+    return [
+        {
+            "slug": get_slug_from_string(ele["value"].get("label", "")),
+            "type": ele["type"],
+            **ele["value"],
+        }
+        for ele in raw_data
+    ]
+
+
+def backfill_fields_data(model, batch_size=500):
+    """
+    Stores fields schema of existing forms, forms are updated
+    in primary key ordered chunks. Returns number of updated forms.
+    """
+    updated = 0
+    last_pk = None
+    while True:
+        queryset = model.objects.order_by("pk").only("pk", "fields")
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        batch = list(queryset[:batch_size])
+        if not batch:
+            return updated
+        for form in batch:
+            form.fields_data = get_fields_data(form.fields.raw_data)
+        model.objects.bulk_update(batch, ["fields_data"])
+        updated += len(batch)
+        last_pk = batch[-1].pk
+
+
+def convert_submissions_form_data(model, batch_size=1000, start_after=None):
+    """
+    Moves text form data of submissions to JSON 'form_data' column in
+    primary key ordered chunks, each chunk is saved in own transaction.
+    Yields number of converted submissions and last primary key per chunk.
+    """
+    last_pk = start_after
+    while True:
+        queryset = model.objects.filter(form_data__isnull=True).order_by("pk")
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        batch = list(queryset.only("pk", "form_data_text")[:batch_size])
+        if not batch:
+            return
+        for submission in batch:
+            submission.form_data = loads(submission.form_data_text or "{}")
+            submission.form_data_text = ""
+        with transaction.atomic():
+            model.objects.bulk_update(batch, ["form_data", "form_data_text"])
+        last_pk = batch[-1].pk
+        yield len(batch), last_pk
+
+
+def get_source_translation_keys(instances):
+    """
+    Returns translation keys of the instances which are
+    sources of their translations, resolved in one query.
+    """
+    instances = list(instances)
+    if not instances:
+        return set()
     translation_source_model = apps.get_model(
         app_label="wagtail_localize",
         model_name="translationsource",
     )
-    return translation_source_model.objects.all().values_list(
-        "content_json",
-        flat=True,
+    sources = translation_source_model.objects.filter(
+        object_id__in={instance.translation_key for instance in instances},
+        object__content_type=ContentType.objects.get_for_model(
+            instances[0].get_translation_model(),
+        ),
+    ).values_list("object_id", "locale_id")
+    sources = set(sources)
+    return {
+        instance.translation_key
+        for instance in instances
+        if (instance.translation_key, instance.locale_id) in sources
+    }
+
+
+def is_translation_source(instance):
+    """
+    Checks if the instance is the source of its translations,
+    i.e. TranslationSource was extracted from it.
+    """
+    translation_source_model = apps.get_model(
+        app_label="wagtail_localize",
+        model_name="translationsource",
     )
+    return translation_source_model.objects.filter(
+        object_id=instance.translation_key,
+        object__content_type=ContentType.objects.get_for_model(
+            instance.get_translation_model(),
+        ),
+        locale_id=instance.locale_id,
+    ).exists()
 
-def get_unique_fields_names():
-    model = get_translatableform_model()
+
+def get_unique_fields_names(model=None, from_source=False):
+    """
+    Returns names of the model fields which values must be unique
+    across translations. Result is built once per model from its
+    '_meta' ('unique=True' fields and 'UniqueConstraint's).
+    Pass 'from_source=True' to fall back on parsing the model source code.
+    """
+    model = model or get_translatableform_model()
+    if from_source:
+        return get_unique_fields_names_from_source(model)
+    label = model._meta.label_lower
+    fields = _unique_fields_registry.get(label)
+    if fields is None:
+        fields = _unique_fields_registry[label] = frozenset(
+            _collect_unique_fields_names(model),
+        )
+    return fields
+
+
+def _collect_unique_fields_names(model):
+    fields = set()
+    for field in model._meta.concrete_fields:
+        if field.unique and not field.primary_key:
+            fields.add(field.name)
+    for constraint in model._meta.total_unique_constraints:
+        # locale always differs between translations,
+        # so constraints that include it are satisfied as is
+        if "locale" in constraint.fields:
+            continue
+        fields.update(constraint.fields)
+    return fields
+
+
+def get_unique_fields_names_from_source(model=None):
+    model = model or get_translatableform_model()
     classes = inspect.getmro(model)
     fields = set()
     for class_ in classes[::-1]:
-        with contextlib.suppress(TypeError):
+        with contextlib.suppress(TypeError, OSError):
             class_source = inspect.getsource(class_)
             class_node = ast.parse(class_source)
             for node in class_node.body[0].body:
@@ -33,4 +177,43 @@ def get_unique_fields_names():
                     continue
                 if "keyword('unique', Constant(True))" in ast.dump(node.value, False):
                     fields.add(node.targets[0].id)
-    return fields
\ No newline at end of file
+    return fields
+
+
+def get_translatable_fields_names(model):
+    """
+    Returns names of the model fields which are translated by
+    wagtail-localize, synchronized fields are not included.
+    """
+    label = model._meta.label_lower
+    fields = _translatable_fields_registry.get(label)
+    if fields is None:
+        fields = _translatable_fields_registry[label] = frozenset(
+            field.field_name
+            for field in get_translatable_fields(model)
+            if isinstance(field, TranslatableField)
+        )
+    return fields
+
+
+def get_translatable_content_fingerprint(instance):
+    """Returns hash of the instance translatable fields values."""
+    content = {}
+    for name in get_translatable_fields_names(type(instance)):
+        field = instance._meta.get_field(name)
+        value = field.value_from_object(instance)
+        if isinstance(field, StreamField):
+            value = field.stream_block.get_prep_value(value)
+        content[name] = value
+    return hashlib.sha1(
+        dumps(content, sort_keys=True, cls=DjangoJSONEncoder).encode(),
+    ).hexdigest()
+
+
+def invalidate_unique_fields_names(sender, **kwargs):
+    """Drops cached fields names when model class is (re)prepared."""
+    _unique_fields_registry.pop(sender._meta.label_lower, None)
+    _translatable_fields_registry.pop(sender._meta.label_lower, None)
+
+
+class_prepared.connect(invalidate_unique_fields_names)
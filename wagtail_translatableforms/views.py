@@ -1,5 +1,17 @@
+import csv
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections.abc import Sequence
+from json import dumps, loads
+
+from django.conf import settings
 from django.contrib.admin.utils import quote
+from django.core.cache import cache
+from django.db.models import Q
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.urls import reverse
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import smart_str
 from wagtail.contrib.modeladmin.helpers import AdminURLHelper
 from wagtail.contrib.modeladmin.helpers import ButtonHelper
 from wagtail.contrib.modeladmin.options import modeladmin_register
@@ -8,10 +20,15 @@ from wagtail.snippets.views.snippets import (
     SnippetViewSet,
     DeleteView,
 )
+from wagtailstreamforms.forms import SelectDateForm
+from wagtailstreamforms.serializers import FormSubmissionSerializer
 from wagtailstreamforms.views import SubmissionListView, SubmissionDeleteView
 from wagtailstreamforms.wagtail_hooks import FormModelAdmin
 
 from . import get_translatableform_model
+from .models import CustomFormSubmissionFile
+from .submission_stats import annotate_submission_stats, delete_submissions
+from .utils import batched
 
 
 class CustomFormURLHelper(AdminURLHelper):
@@ -86,16 +103,230 @@ class CustomFormModelAdmin(FormModelAdmin):
     url_helper_class = CustomFormURLHelper
     index_template_name = "customforms/index.html"
 
+    def get_queryset(self, request):
+        return annotate_submission_stats(super().get_queryset(request))
+
+    def latest_submission(self, obj):
+        if not hasattr(obj, "latest_submit_time"):
+            return super().latest_submission(obj)
+        return obj.latest_submit_time
+
+    latest_submission.short_description = FormModelAdmin.latest_submission.short_description
+
+    def saved_submissions(self, obj):
+        if not hasattr(obj, "submissions_count"):
+            return super().saved_submissions(obj)
+        return obj.submissions_count
+
+    saved_submissions.short_description = FormModelAdmin.saved_submissions.short_description
+
+
+def encode_cursor(submission):
+    value = f"{submission.submit_time.isoformat()}|{submission.pk}"
+    return urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Returns (submit_time, pk) encoded in cursor or None if it is not valid."""
+    try:
+        submit_time, pk = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        submit_time = parse_datetime(submit_time)
+        if submit_time is None:
+            return None
+        return submit_time, int(pk)
+    except (BinasciiError, UnicodeError, ValueError):
+        return None
+
+
+class Echo:
+    """File-like object which returns written value, used to stream CSV."""
+
+    def write(self, value):
+        return value
+
+
+class KeysetPage(Sequence):
+    """Page of submissions selected by cursor instead of offset."""
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self.object_list[-1]) if self.object_list else ""
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(self.object_list[0]) if self.object_list else ""
+
 
 class CustomSubmissionListView(SubmissionListView):
+    """
+    Submissions are paginated by (submit_time, id) cursor, so any page
+    costs as much as the first one using (form, submit_time, id) index.
+    """
+
     template_name = "customforms/index_submissions.html"
     model = get_translatableform_model()
 
+    def paginate_queryset(self, queryset, page_size):
+        after = decode_cursor(self.request.GET.get("after", ""))
+        before = decode_cursor(self.request.GET.get("before", ""))
+        if before and not after:
+            submit_time, pk = before
+            object_list = list(
+                queryset.filter(
+                    Q(submit_time__gt=submit_time) | Q(submit_time=submit_time, pk__gt=pk),
+                ).order_by("submit_time", "pk")[:page_size + 1],
+            )
+            page = KeysetPage(
+                object_list[:page_size][::-1],
+                has_next=True,
+                has_previous=len(object_list) > page_size,
+            )
+        else:
+            queryset = queryset.order_by("-submit_time", "-pk")
+            if after:
+                submit_time, pk = after
+                queryset = queryset.filter(
+                    Q(submit_time__lt=submit_time) | Q(submit_time=submit_time, pk__lt=pk),
+                )
+            object_list = list(queryset[:page_size + 1])
+            page = KeysetPage(
+                object_list[:page_size],
+                has_next=len(object_list) > page_size,
+                has_previous=bool(after),
+            )
+        return None, page, page.object_list, page.has_other_pages()
+
+    def get_submissions_count(self):
+        """Returns count of filtered submissions cached for a short time."""
+        key = "wagtail_translatableforms:submissions_count:{}:{}:{}".format(
+            self.object.pk,
+            self.request.GET.get("date_from", ""),
+            self.request.GET.get("date_to", ""),
+        )
+        count = cache.get(key)
+        if count is None:
+            count = self.get_queryset().count()
+            cache.set(
+                key,
+                count,
+                getattr(settings, "WAGTAIL_TRANSLATABLEFORM_SUBMISSIONS_COUNT_TIMEOUT", 60),
+            )
+        return count
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["submissions_count"] = self.get_submissions_count()
+        return context
+
+    def get(self, request, *args, **kwargs):
+        if request.GET.get("action") == "NDJSON":
+            self.filter_form = SelectDateForm(request.GET)
+            return self.ndjson()
+        return super().get(request, *args, **kwargs)
+
+    def iter_submissions(self, chunk_size=2000):
+        """
+        Yields form data and file urls of filtered submissions. Only needed
+        columns are fetched by chunks, so memory use does not depend on
+        number of submissions.
+        """
+        queryset = self.get_queryset().prefetch_related(None).order_by(
+            "-submit_time", "-pk",
+        ).values_list("pk", "form_data", "form_data_text", "submit_time")
+        storage = CustomFormSubmissionFile._meta.get_field("file").storage
+        for chunk in batched(queryset.iterator(chunk_size=chunk_size), chunk_size):
+            files = {}
+            for submission_id, name in CustomFormSubmissionFile.objects.filter(
+                submission_id__in=[row[0] for row in chunk],
+            ).values_list("submission_id", "file"):
+                files.setdefault(submission_id, []).append(storage.url(name))
+            for pk, form_data, form_data_text, submit_time in chunk:
+                if form_data is None:
+                    form_data = loads(form_data_text or "{}")
+                form_data["submit_time"] = submit_time
+                yield form_data, files.get(pk, [])
+
+    def csv(self, include_files=False):
+        """
+        Streams CSV with 'Download CSV' columns, 'Files'
+        column with file urls is added if 'include_files' is set.
+        """
+        data_fields = self.object.get_data_fields()
+
+        def rows():
+            writer = csv.writer(Echo())
+            header = [smart_str(label) for name, label in data_fields]
+            yield writer.writerow(header + ["Files"] if include_files else header)
+            for form_data, files in self.iter_submissions():
+                row = [smart_str(form_data.get(name)) for name, label in data_fields]
+                if include_files:
+                    row.append(" ".join(files))
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(rows(), content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = "attachment;filename=export.csv"
+        return response
+
+    def ndjson(self):
+        data_fields = self.object.get_data_fields()
+
+        def rows():
+            for form_data, files in self.iter_submissions():
+                row = {name: form_data.get(name) for name, label in data_fields}
+                row["files"] = files
+                yield dumps(row, cls=FormSubmissionSerializer) + "\n"
+
+        response = StreamingHttpResponse(
+            rows(),
+            content_type="application/x-ndjson; charset=utf-8",
+        )
+        response["Content-Disposition"] = "attachment;filename=export.ndjson"
+        return response
+
+
+class CustomSubmissionExportView(CustomSubmissionListView):
+    """
+    Streams filtered submissions as CSV or NDJSON ('format' parameter),
+    both with file urls of submissions.
+    """
+
+    def get(self, request, *args, **kwargs):
+        self.filter_form = SelectDateForm(request.GET)
+        if request.GET.get("format", "csv").lower() == "ndjson":
+            return self.ndjson()
+        return self.csv(include_files=True)
+
 
 class CustomSubmissionDeleteView(SubmissionDeleteView):
     model = get_translatableform_model()
     template_name = "customforms/confirm_delete.html"
 
+    def form_valid(self, form):
+        success_url = self.get_success_url()
+        count = delete_submissions(self.get_submissions())
+        self.create_success_message(count)
+        return HttpResponseRedirect(success_url)
+
     def get_success_url(self):
         return reverse(
             "wagtail_translatableforms:streamforms_submissions",